@@ -6,7 +6,9 @@ Provides mapping between different data formats and Zotero schema.
 
 from .pubmed_mapper import (
     extract_doi_from_zotero_item,
+    extract_pmid_from_extra,
     extract_pmid_from_zotero_item,
+    iter_map_pubmed_to_zotero,
     map_pubmed_list_to_zotero,
     map_pubmed_to_zotero,
 )
@@ -22,7 +24,9 @@ from .zotero_schema import (
 __all__ = [
     "map_pubmed_to_zotero",
     "map_pubmed_list_to_zotero",
+    "iter_map_pubmed_to_zotero",
     "extract_pmid_from_zotero_item",
+    "extract_pmid_from_extra",
     "extract_doi_from_zotero_item",
     "ZOTERO_ITEM_FIELDS",
     "CONTAINER_FIELD",
@@ -6,11 +6,36 @@ Ensures complete metadata preservation.
 """
 
 import logging
+import re
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_PMID_EXTRA_RE = re.compile(r"PMID:\s*(\d+)", re.IGNORECASE)
+
+# PubMed month names are always English, so the table is seeded from a fixed
+# tuple rather than the locale-dependent calendar module: "jan"/"january" -> "01".
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_MONTH_LOOKUP: dict[str, str] = {
+    key: f"{num:02d}" for num, name in enumerate(_MONTH_NAMES, start=1) for key in (name[:3], name)
+}
+
 
 def map_pubmed_to_zotero(
     article: dict[str, Any],
@@ -61,55 +86,41 @@ def map_pubmed_to_zotero(
         "abstractNote": article.get("abstract", ""),  # 完整摘要！
     }
 
-    # Creators (authors)
-    creators = []
+    # Creators (authors) - collected as (firstName, lastName) pairs,
+    # converted to Zotero creator dicts once at the end
+    creator_names: list[tuple[str, str]] = []
     authors_full = article.get("authors_full", [])
 
     if authors_full:
         for author in authors_full:
-            creator = {
-                "creatorType": "author",
-            }
             # Handle different author formats
             if isinstance(author, dict):
-                creator["firstName"] = author.get("fore_name", author.get("forename", ""))
-                creator["lastName"] = author.get("last_name", author.get("lastname", ""))
+                first_name = author.get("fore_name", author.get("forename", "")) or ""
+                last_name = author.get("last_name", author.get("lastname", "")) or ""
             else:
                 # Fallback for string format
                 parts = str(author).rsplit(" ", 1)
                 if len(parts) == 2:
-                    creator["firstName"] = parts[0]
-                    creator["lastName"] = parts[1]
+                    first_name, last_name = parts
                 else:
-                    creator["lastName"] = str(author)
-                    creator["firstName"] = ""
+                    first_name, last_name = "", str(author)
 
-            if creator.get("lastName"):  # Only add if has last name
-                creators.append(creator)
+            if last_name:  # Only add if has last name
+                creator_names.append((first_name, last_name))
 
     # Fallback to simple authors list if no authors_full
-    if not creators and article.get("authors"):
+    if not creator_names and article.get("authors"):
         for author_name in article.get("authors", []):
             parts = str(author_name).rsplit(" ", 1)
             if len(parts) == 2:
-                creators.append(
-                    {
-                        "creatorType": "author",
-                        "firstName": parts[0],
-                        "lastName": parts[1],
-                    }
-                )
+                creator_names.append((parts[0], parts[1]))
             else:
-                creators.append(
-                    {
-                        "creatorType": "author",
-                        "lastName": author_name,
-                        "firstName": "",
-                    }
-                )
+                creator_names.append(("", author_name))
 
-    if creators:
-        item["creators"] = creators
+    if creator_names:
+        item["creators"] = [
+            {"creatorType": "author", "firstName": first_name, "lastName": last_name} for first_name, last_name in creator_names
+        ]
 
     # Journal info
     if article.get("journal"):
@@ -219,32 +230,23 @@ def map_pubmed_to_zotero(
     if extra_parts:
         item["extra"] = "\n".join(extra_parts)
 
-    # Tags - keywords + MeSH terms + user tags
-    tags = []
-
-    # Author keywords
-    keywords = article.get("keywords", [])
-    for kw in keywords:
-        if kw and kw.strip():
-            tags.append({"tag": kw.strip()})
-
-    # MeSH terms with prefix
-    mesh_terms = article.get("mesh_terms", [])
-    for mesh in mesh_terms:
-        if mesh and mesh.strip():
-            tags.append({"tag": f"MeSH: {mesh.strip()}"})
-
-    # User-provided extra tags
-    if extra_tags:
-        for tag in extra_tags:
-            if tag and tag.strip():
-                # Avoid duplicates
-                tag_exists = any(t["tag"].lower() == tag.strip().lower() for t in tags)
-                if not tag_exists:
-                    tags.append({"tag": tag.strip()})
-
-    if tags:
-        item["tags"] = tags
+    # Tags - keywords + MeSH terms (prefix: MeSH:) + user tags, in one pass
+    tag_values: list[str] = []
+    seen_tags: set[str] = set()
+    mesh_terms = (f"MeSH: {mesh.strip()}" for mesh in article.get("mesh_terms", []) if mesh and mesh.strip())
+
+    for tag in chain(article.get("keywords", []), mesh_terms, extra_tags or ()):
+        if not tag or not tag.strip():
+            continue
+        tag = tag.strip()
+        # Avoid duplicates (case-insensitive)
+        key = tag.lower()
+        if key not in seen_tags:
+            seen_tags.add(key)
+            tag_values.append(tag)
+
+    if tag_values:
+        item["tags"] = [{"tag": tag} for tag in tag_values]
 
     # Collections - add to specified collections
     if collection_keys:
@@ -254,7 +256,7 @@ def map_pubmed_to_zotero(
 
 
 def _month_to_number(month: str) -> str | None:
-    """Convert month name or abbreviation to two-digit number."""
+    """Convert month name, abbreviation or number to two-digit number."""
     if not month:
         return None
 
@@ -262,33 +264,7 @@ def _month_to_number(month: str) -> str | None:
     if month.isdigit():
         return str(int(month)).zfill(2)
 
-    month_map = {
-        "jan": "01",
-        "january": "01",
-        "feb": "02",
-        "february": "02",
-        "mar": "03",
-        "march": "03",
-        "apr": "04",
-        "april": "04",
-        "may": "05",
-        "jun": "06",
-        "june": "06",
-        "jul": "07",
-        "july": "07",
-        "aug": "08",
-        "august": "08",
-        "sep": "09",
-        "september": "09",
-        "oct": "10",
-        "october": "10",
-        "nov": "11",
-        "november": "11",
-        "dec": "12",
-        "december": "12",
-    }
-
-    return month_map.get(month.lower().strip())
+    return _MONTH_LOOKUP.get(month.lower().strip())
 
 
 def _extract_unique_affiliations(authors_full: list[dict]) -> list[str]:
@@ -324,7 +300,40 @@ def map_pubmed_list_to_zotero(
     Returns:
         List of Zotero items
     """
-    return [map_pubmed_to_zotero(article, extra_tags) for article in articles]
+    return list(iter_map_pubmed_to_zotero(articles, extra_tags))
+
+
+def iter_map_pubmed_to_zotero(
+    articles: Iterable[dict[str, Any]],
+    extra_tags: list[str] | None = None,
+    collection_keys: list[str] | None = None,
+    on_error: Callable[[dict[str, Any], Exception], None] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily map PubMed articles to Zotero items, one at a time.
+
+    Streaming counterpart of map_pubmed_list_to_zotero() for large imports:
+    consumers can save items in batches without holding every mapped item.
+
+    Args:
+        articles: Iterable of article dicts from PubMedClient
+        extra_tags: Tags to add to all items
+        collection_keys: Zotero collection keys to add all items to
+        on_error: Called with the article and exception when mapping fails;
+                  the article is then skipped. Without it the error is raised.
+
+    Yields:
+        Zotero items
+    """
+    for article in articles:
+        try:
+            item = map_pubmed_to_zotero(article, extra_tags, collection_keys)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(article, e)
+            continue
+        yield item
 
 
 def extract_pmid_from_zotero_item(item: dict[str, Any]) -> str | None:
@@ -333,26 +342,23 @@ def extract_pmid_from_zotero_item(item: dict[str, Any]) -> str | None:
 
     Checks native PMID field first (Zotero 6+), then 'extra' field.
     """
-    import re
-
     data = item.get("data", item)
 
     # Check native PMID field first
-    native_pmid = data.get("PMID", "")
+    native_pmid = data.get("PMID")
     if native_pmid:
         return str(native_pmid).strip()
 
     # Fall back to extra field
-    extra = data.get("extra", "")
+    return extract_pmid_from_extra(data.get("extra"))
+
 
+def extract_pmid_from_extra(extra: str | None) -> str | None:
+    """Extract PMID from a Zotero 'extra' field (e.g. "PMID: 12345678")."""
     if not extra:
         return None
-
-    match = re.search(r"PMID:\s*(\d+)", extra, re.IGNORECASE)
-    if match:
-        return match.group(1)
-
-    return None
+    match = _PMID_EXTRA_RE.search(extra)
+    return match.group(1) if match else None
 
 
 def extract_doi_from_zotero_item(item: dict[str, Any]) -> str | None:
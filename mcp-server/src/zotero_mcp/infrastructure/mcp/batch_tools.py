@@ -11,6 +11,8 @@ Preferred path:
 
 import logging
 import time
+from collections import deque
+from itertools import islice
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -22,10 +24,11 @@ from ...domain.entities.batch_result import (
     ImportedItem,
 )
 from .collection_support import resolve_collection_target
+from .unified_import_tools import SAVE_BATCH_SIZE
 
 # Import mappers  # noqa: E402
 from ..mappers.pubmed_mapper import (
-    map_pubmed_to_zotero,
+    iter_map_pubmed_to_zotero,
 )
 
 # Import pubmed integration  # noqa: E402
@@ -95,7 +98,8 @@ def register_batch_tools(mcp, zotero_client):
         Args:
             pmids: Comma-separated PMIDs (e.g., "38353755,37864754")
             tags: Additional tags to apply to all imported articles
-            skip_duplicates: Skip if exact PMID or DOI match found (default: True)
+            skip_duplicates: Skip if exact PMID or DOI match found, and skip PMIDs
+                             repeated within this request (default: True)
             collection_key: Zotero collection key (⚠️ 不建議直接使用，容易出錯)
             collection_name: Collection name (推薦! 自動驗證並解析為 key)
             include_citation_metrics: If True, fetch RCR/percentile from iCite
@@ -230,7 +234,9 @@ def register_batch_tools(mcp, zotero_client):
                         article["apt"] = metrics.get("apt")
 
             # 3. Check for duplicates (batch)
-            existing_identifiers: dict[str, Any] = {"existing_pmids": set(), "existing_dois": set()}
+            # Normalized once per batch so the per-article checks below are plain lookups
+            existing_pmids: frozenset[str] = frozenset()
+            existing_dois: frozenset[str] = frozenset()
             pmid_to_key: dict[str, str] = {}
             doi_to_key: dict[str, str] = {}
 
@@ -243,87 +249,108 @@ def register_batch_tools(mcp, zotero_client):
                         pmids=pmid_list,
                         dois=article_dois,
                     )
-                    existing_identifiers = check_result
+                    existing_pmids = frozenset(check_result.get("existing_pmids", ()))
+                    existing_dois = frozenset(check_result.get("existing_dois", ()))
                     pmid_to_key = check_result.get("pmid_to_key", {})
                     doi_to_key = check_result.get("doi_to_key", {})
 
-                    logger.info(
-                        f"Duplicate check: {len(existing_identifiers['existing_pmids'])} PMIDs, "
-                        f"{len(existing_identifiers['existing_dois'])} DOIs already exist"
-                    )
+                    logger.info(f"Duplicate check: {len(existing_pmids)} PMIDs, {len(existing_dois)} DOIs already exist")
                 except Exception as e:
                     logger.warning(f"Duplicate check failed: {e}")
                     # Continue without duplicate checking
 
-            # 4. Process each article
-            items_to_save = []
+            # 4. Process each article lazily; mapped items are produced on demand
+            # so at most SAVE_BATCH_SIZE of them are held in memory at once.
+            collection_keys = [validated_collection_key] if validated_collection_key else None
 
-            for article in articles:
-                pmid = article.get("pmid", "")
-                title = article.get("title", "Unknown")[:100]
-                doi = article.get("doi", "").lower()
+            # PMIDs already handled in this call; with skip_duplicates a repeat
+            # (e.g. pasted twice) is skipped instead of creating a second item.
+            seen_pmids: set[str] = set()
 
-                # Check if duplicate
-                if skip_duplicates:
-                    if pmid in existing_identifiers.get("existing_pmids", set()):
-                        result.add_item(
-                            ImportedItem(
-                                pmid=pmid,
-                                title=title,
-                                action=ImportAction.SKIPPED,
-                                reason=f"PMID already exists (key: {pmid_to_key.get(pmid, 'unknown')})",
-                            )
-                        )
-                        continue
+            # (pmid, title) of each article handed to the mapper and not yet saved,
+            # in order, so results can be reported against the mapped items
+            queued: deque[tuple[str, str]] = deque()
 
-                    if doi and doi in existing_identifiers.get("existing_dois", set()):
-                        result.add_item(
-                            ImportedItem(
-                                pmid=pmid,
-                                title=title,
-                                action=ImportAction.SKIPPED,
-                                reason=f"DOI already exists (key: {doi_to_key.get(doi, 'unknown')})",
+            def iter_articles_to_save():
+                for article in articles:
+                    pmid = article.get("pmid", "")
+                    title = article.get("title", "Unknown")[:100]
+                    doi = article.get("doi", "").lower()
+
+                    # Check if duplicate
+                    if skip_duplicates:
+                        if pmid in seen_pmids:
+                            result.add_item(
+                                ImportedItem(
+                                    pmid=pmid,
+                                    title=title,
+                                    action=ImportAction.SKIPPED,
+                                    reason="PMID repeated in this request",
+                                )
                             )
-                        )
-                        continue
-
-                # Map to Zotero schema (complete metadata!)
-                try:
-                    # Pass validated collection_key to mapper
-                    collection_keys = [validated_collection_key] if validated_collection_key else None
-                    zotero_item = map_pubmed_to_zotero(
-                        article,
-                        extra_tags=tags,
-                        collection_keys=collection_keys,
-                    )
-                    items_to_save.append((pmid, title, zotero_item))
-                except Exception as e:
-                    logger.error(f"Failed to map article {pmid}: {e}")
-                    result.add_item(
-                        ImportedItem(
-                            pmid=pmid,
-                            title=title,
-                            action=ImportAction.FAILED,
-                            error=f"Mapping error: {e}",
-                        )
+                            continue
+                        if pmid:
+                            seen_pmids.add(pmid)
+
+                        if pmid in existing_pmids:
+                            result.add_item(
+                                ImportedItem(
+                                    pmid=pmid,
+                                    title=title,
+                                    action=ImportAction.SKIPPED,
+                                    reason=f"PMID already exists (key: {pmid_to_key.get(pmid, 'unknown')})",
+                                )
+                            )
+                            continue
+
+                        if doi and doi in existing_dois:
+                            result.add_item(
+                                ImportedItem(
+                                    pmid=pmid,
+                                    title=title,
+                                    action=ImportAction.SKIPPED,
+                                    reason=f"DOI already exists (key: {doi_to_key.get(doi, 'unknown')})",
+                                )
+                            )
+                            continue
+
+                    queued.append((pmid, title))
+                    yield article
+
+            def report_mapping_error(article: dict[str, Any], e: Exception) -> None:
+                # The failed article is the one just queued
+                pmid, title = queued.pop()
+                logger.error(f"Failed to map article {pmid}: {e}")
+                result.add_item(
+                    ImportedItem(
+                        pmid=pmid,
+                        title=title,
+                        action=ImportAction.FAILED,
+                        error=f"Mapping error: {e}",
                     )
+                )
+
+            # Map to Zotero schema (complete metadata!)
+            mapped_items = iter_map_pubmed_to_zotero(
+                iter_articles_to_save(),
+                extra_tags=tags,
+                collection_keys=collection_keys,
+                on_error=report_mapping_error,
+            )
 
-            # 5. Batch save to Zotero
-            if items_to_save:
+            # 5. Save to Zotero in connector-sized batches
+            while batch := list(islice(mapped_items, SAVE_BATCH_SIZE)):
+                labels = [queued.popleft() for _ in batch]
                 try:
-                    # Extract just the items for saving
-                    zotero_items = [item[2] for item in items_to_save]
-
                     await zotero_client.batch_save_items(
-                        items=zotero_items,
+                        items=batch,
                         uri="http://mcp-bridge.local/batch-import-from-pubmed",
                         title="PubMed Batch Import",
                     )
 
-                    # Process save results
                     # Note: Zotero Connector API doesn't return individual keys easily
                     # So we mark all as added for now
-                    for pmid, title, _ in items_to_save:
+                    for pmid, title in labels:
                         result.add_item(
                             ImportedItem(
                                 pmid=pmid,
@@ -333,12 +360,12 @@ def register_batch_tools(mcp, zotero_client):
                             )
                         )
 
-                    logger.info(f"Saved {len(items_to_save)} items to Zotero")
+                    logger.info(f"Saved {len(batch)} items to Zotero")
 
                 except Exception as e:
                     logger.error(f"Failed to save to Zotero: {e}")
-                    # Mark all pending items as failed
-                    for pmid, title, _ in items_to_save:
+                    # Mark all items of this batch as failed
+                    for pmid, title in labels:
                         result.add_item(
                             ImportedItem(
                                 pmid=pmid,
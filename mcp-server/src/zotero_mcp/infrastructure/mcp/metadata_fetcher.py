@@ -10,6 +10,7 @@ Supports:
 - CrossRef API (via DOI)
 """
 
+import copy
 import logging
 import re
 
@@ -36,6 +37,12 @@ def _get_crossref_client() -> httpx.AsyncClient:
     return _crossref_client
 
 
+# Successful CrossRef lookups keyed by lowercased DOI (DOIs are case-insensitive).
+# Failures are not cached so transient errors can be retried.
+_DOI_CACHE_MAXSIZE = 1024
+_doi_cache: dict[str, dict] = {}
+
+
 async def fetch_metadata_from_pmid(pmid: str, include_citation_metrics: bool = True) -> dict | None:
     """
     Fetch complete article metadata from PubMed using PMID.
@@ -77,6 +84,7 @@ async def fetch_metadata_from_doi(doi: str) -> dict | None:
     Fetch complete article metadata from CrossRef using DOI.
 
     Returns Zotero-compatible item dict with all fields including abstract.
+    Successful lookups are cached per DOI for the lifetime of the process.
 
     Args:
         doi: Digital Object Identifier
@@ -84,6 +92,11 @@ async def fetch_metadata_from_doi(doi: str) -> dict | None:
     Returns:
         Zotero-compatible item dict, or None if fetch fails
     """
+    cache_key = doi.strip().lower()
+    cached = _doi_cache.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     try:
         url = f"https://api.crossref.org/works/{doi}"
         client = _get_crossref_client()
@@ -149,7 +162,11 @@ async def fetch_metadata_from_doi(doi: str) -> dict | None:
             item["url"] = data["URL"]
 
         logger.info(f"Fetched complete metadata from DOI {doi}")
-        return item
+        if len(_doi_cache) >= _DOI_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _doi_cache[next(iter(_doi_cache))]
+        _doi_cache[cache_key] = item
+        return copy.deepcopy(item)
 
     except Exception as e:
         logger.warning(f"Failed to fetch metadata from DOI {doi}: {e}")
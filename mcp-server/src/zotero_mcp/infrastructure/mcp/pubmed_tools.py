@@ -15,6 +15,7 @@ Alternative (requires pubmed extra):
 """
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from ..pubmed import fetch_pubmed_articles, is_pubmed_available as pubmed_integration_available
@@ -23,9 +24,9 @@ from .collection_support import apply_collection_and_tags, attach_saved_to_info,
 logger = logging.getLogger(__name__)
 
 
-def _parse_ris_to_zotero_items(ris_text: str) -> list[dict[str, Any]]:
+def _iter_ris_to_zotero_items(ris_text: str | Iterable[str]) -> Iterator[dict[str, Any]]:
     """
-    Parse RIS format text to Zotero item format.
+    Lazily parse RIS format text, yielding one Zotero item per record.
 
     RIS tags reference:
     - TY: Type (JOUR = journalArticle)
@@ -41,9 +42,15 @@ def _parse_ris_to_zotero_items(ris_text: str) -> list[dict[str, Any]]:
     - KW: Keywords
     - UR: URL
     """
-    from .unified_import_tools import _parse_ris_to_articles, _unified_article_to_zotero
+    from .unified_import_tools import _iter_ris_articles, _unified_article_to_zotero
+
+    for article in _iter_ris_articles(ris_text):
+        yield _unified_article_to_zotero(article)
 
-    return [_unified_article_to_zotero(article) for article in _parse_ris_to_articles(ris_text)]
+
+def _parse_ris_to_zotero_items(ris_text: str) -> list[dict[str, Any]]:
+    """Parse RIS format text to a list of Zotero items (see _iter_ris_to_zotero_items)."""
+    return list(_iter_ris_to_zotero_items(ris_text))
 
 
 def _pmid_to_zotero_item(article: dict) -> dict[str, Any]:
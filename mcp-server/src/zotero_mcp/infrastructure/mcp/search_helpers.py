@@ -13,19 +13,24 @@ import re
 
 from rapidfuzz import fuzz
 
+from ..mappers.pubmed_mapper import extract_pmid_from_extra
+
 logger = logging.getLogger(__name__)
 
 # Matching configuration
 TITLE_MATCH_THRESHOLD = 85
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def normalize_title(title: str | None) -> str:
     """Normalize title for comparison."""
     if not title:
         return ""
     title = title.lower()
-    title = re.sub(r"[^\w\s]", " ", title)
-    title = re.sub(r"\s+", " ", title)
+    title = _NON_WORD_RE.sub(" ", title)
+    title = _WHITESPACE_RE.sub(" ", title)
     return title.strip()
 
 
@@ -37,19 +42,7 @@ def extract_pmid_from_item(data: dict) -> str | None:
         return str(native_pmid).strip()
 
     # Fall back to extra field
-    extra = data.get("extra", "")
-    if not extra:
-        return None
-    match = re.search(r"PMID:\s*(\d+)", extra, re.IGNORECASE)
-    return match.group(1) if match else None
-
-
-def extract_pmid_from_extra(extra: str | None) -> str | None:
-    """Extract PMID from Zotero extra field."""
-    if not extra:
-        return None
-    match = re.search(r"PMID:\s*(\d+)", extra, re.IGNORECASE)
-    return match.group(1) if match else None
+    return extract_pmid_from_extra(data.get("extra"))
 
 
 async def get_owned_identifiers(zotero_client, limit: int = 500) -> dict[str, set]:
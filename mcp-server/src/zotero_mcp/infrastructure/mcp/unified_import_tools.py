@@ -37,10 +37,12 @@ Example:
     )
 """
 
+import io
 import logging
 import mimetypes
 import re
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -60,6 +62,32 @@ logger = logging.getLogger(__name__)
 MAX_IMPORT_ARTICLES = 100
 SAVE_BATCH_SIZE = 50
 
+# RIS parsing patterns, compiled once. Lines are stripped before matching.
+# The value is optional so a bare end-of-record line ("ER  -") still matches.
+_RIS_LINE_RE = re.compile(r"^([A-Z][A-Z0-9])\s+-(?:\s+(.*))?$")
+_ISSN_RE = re.compile(r"^\d{4}-\d{3}[\dxX]$")
+_DIGITS_RE = re.compile(r"(\d+)")
+
+# RIS reference type -> unified article type
+_RIS_TYPE_MAP = {
+    "JOUR": "journal-article",
+    "BOOK": "book",
+    "CHAP": "book-chapter",
+    "CONF": "conference-paper",
+    "CPAPER": "conference-paper",
+    "THES": "thesis",
+    "RPRT": "report",
+    "ELEC": "webpage",
+    "WEB": "webpage",
+    "COMP": "computer-program",
+    "DATA": "dataset",
+    "MGZN": "magazine-article",
+    "NEWS": "newspaper-article",
+    "MANSCPT": "manuscript",
+    "UNPB": "manuscript",
+    "GEN": "document",
+}
+
 
 class ArticleAuthorPayload(BaseModel):
     model_config = ConfigDict(extra="allow")
@@ -521,74 +549,59 @@ def _unified_article_to_zotero(article: dict[str, Any]) -> dict[str, Any]:
     return finalize_item_for_schema(item)
 
 
-def _parse_ris_to_articles(ris_text: str) -> list[dict[str, Any]]:
+def _iter_ris_articles(ris_text: str | Iterable[str]) -> Iterator[dict[str, Any]]:
     """
-    Parse RIS format text to article dicts.
+    Lazily parse RIS format text, yielding one article dict per record.
 
     Captures bibliographic fields across item types (journal articles, books,
     book chapters, conference papers, theses, reports, web pages, software,
     datasets) including publisher, place, ISBN/ISSN, edition, series, editors
     and book/proceedings titles so the importer can build complete records.
+    Records are yielded as soon as their ``ER`` (or the next ``TY``) is seen.
+    Accepts the RIS text itself or any iterable of lines (e.g. an open file),
+    which is consumed only as far as the record being yielded.
     """
-    articles: list[dict[str, Any]] = []
     current_article: dict[str, Any] = {}
     current_authors: list[str] = []
     current_editors: list[str] = []
     current_keywords: list[str] = []
 
-    # RIS reference type -> unified article type
-    type_map = {
-        "JOUR": "journal-article",
-        "BOOK": "book",
-        "CHAP": "book-chapter",
-        "CONF": "conference-paper",
-        "CPAPER": "conference-paper",
-        "THES": "thesis",
-        "RPRT": "report",
-        "ELEC": "webpage",
-        "WEB": "webpage",
-        "COMP": "computer-program",
-        "DATA": "dataset",
-        "MGZN": "magazine-article",
-        "NEWS": "newspaper-article",
-        "MANSCPT": "manuscript",
-        "UNPB": "manuscript",
-        "GEN": "document",
-    }
-
-    def _flush() -> None:
-        if current_article and current_article.get("title"):
-            if current_authors:
-                current_article["authors"] = list(current_authors)
-            if current_editors:
-                current_article["editors"] = list(current_editors)
-            if current_keywords:
-                current_article["keywords"] = list(current_keywords)
-            articles.append(current_article)
-
-    for line in ris_text.strip().split("\n"):
+    def _finish() -> dict[str, Any] | None:
+        if not (current_article and current_article.get("title")):
+            return None
+        if current_authors:
+            current_article["authors"] = list(current_authors)
+        if current_editors:
+            current_article["editors"] = list(current_editors)
+        if current_keywords:
+            current_article["keywords"] = list(current_keywords)
+        return current_article
+
+    lines = io.StringIO(ris_text) if isinstance(ris_text, str) else ris_text
+    for line in lines:
         line = line.strip()
-        if not line or len(line) < 6:
+        if not line:
             continue
 
-        match = re.match(r"^([A-Z][A-Z0-9])\s+-\s+(.*)$", line)
+        match = _RIS_LINE_RE.match(line)
         if not match:
             continue
 
-        tag, value = match.groups()
+        tag, value = match.groups("")
         value = value.strip()
 
+        if tag in ("TY", "ER") and (finished := _finish()) is not None:
+            yield finished
+
         if tag == "TY":
-            _flush()
             current_article = {
                 "primary_source": "ris",
-                "article_type": type_map.get(value, "journal-article"),
+                "article_type": _RIS_TYPE_MAP.get(value, "journal-article"),
             }
             current_authors = []
             current_editors = []
             current_keywords = []
         elif tag == "ER":
-            _flush()
             current_article = {}
             current_authors = []
             current_editors = []
@@ -628,7 +641,7 @@ def _parse_ris_to_articles(ris_text: str) -> list[dict[str, Any]]:
             current_article["edition"] = value
         elif tag == "SN":
             # Serial number: ISSN (####-####) vs ISBN (everything else)
-            if re.match(r"^\d{4}-\d{3}[\dxX]$", value):
+            if _ISSN_RE.match(value):
                 current_article["issn"] = value
             else:
                 current_article["isbn"] = value
@@ -645,14 +658,18 @@ def _parse_ris_to_articles(ris_text: str) -> list[dict[str, Any]]:
         elif tag == "N1":
             # Notes - often contains PMID
             if "PMID:" in value or value.isdigit():
-                pmid_match = re.search(r"(\d+)", value)
+                pmid_match = _DIGITS_RE.search(value)
                 if pmid_match:
                     current_article["pmid"] = pmid_match.group(1)
 
     # Don't forget the last article
-    _flush()
+    if (finished := _finish()) is not None:
+        yield finished
 
-    return articles
+
+def _parse_ris_to_articles(ris_text: str) -> list[dict[str, Any]]:
+    """Parse RIS format text to a list of article dicts (see _iter_ris_articles)."""
+    return list(_iter_ris_articles(ris_text))
 
 
 def register_unified_import_tools(mcp, zotero_client):
@@ -316,7 +316,7 @@ def mock_env(monkeypatch):
 # ============================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def event_loop_policy():
     """Provide event loop policy for async tests."""
     import asyncio
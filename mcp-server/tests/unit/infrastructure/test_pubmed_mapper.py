@@ -4,6 +4,8 @@ Unit tests for PubMed to Zotero mapper.
 Tests all mapping functions and edge cases.
 """
 
+import pytest
+
 
 class TestMapPubmedToZotero:
     """Test map_pubmed_to_zotero function."""
@@ -227,6 +229,19 @@ class TestMapPubmedToZotero:
         count = sum(1 for t in tag_values if t == "artificial intelligence")
         assert count == 1  # Should not duplicate
 
+    def test_map_tags_keep_source_order(self):
+        """Test keywords, MeSH terms and extra tags are emitted in order without duplicates."""
+        from zotero_mcp.infrastructure.mappers.pubmed_mapper import map_pubmed_to_zotero
+
+        article = {
+            "title": "Test",
+            "keywords": ["Sepsis", " sepsis ", ""],
+            "mesh_terms": ["Humans", None],
+        }
+        result = map_pubmed_to_zotero(article, extra_tags=["imported", "SEPSIS"])
+
+        assert [t["tag"] for t in result["tags"]] == ["Sepsis", "MeSH: Humans", "imported"]
+
     def test_map_collection_keys(self, mock_pubmed_article):
         """Test adding collection keys."""
         from zotero_mcp.infrastructure.mappers.pubmed_mapper import map_pubmed_to_zotero
@@ -409,6 +424,39 @@ class TestMapPubmedListToZotero:
         assert result == []
 
 
+class TestIterMapPubmedToZotero:
+    """Test iter_map_pubmed_to_zotero function."""
+
+    def test_iter_map_is_lazy(self, mock_pubmed_articles):
+        """Test articles are mapped one at a time."""
+        from zotero_mcp.infrastructure.mappers.pubmed_mapper import iter_map_pubmed_to_zotero
+
+        result = iter_map_pubmed_to_zotero(iter(mock_pubmed_articles), collection_keys=["COL123"])
+
+        first = next(result)
+        assert first["title"] == mock_pubmed_articles[0]["title"]
+        assert first["collections"] == ["COL123"]
+        assert len(list(result)) == 2
+
+    def test_iter_map_on_error_skips_article(self, mock_pubmed_articles):
+        """Test on_error receives a failing article and mapping continues."""
+        from zotero_mcp.infrastructure.mappers.pubmed_mapper import iter_map_pubmed_to_zotero
+
+        failures = []
+        articles = [mock_pubmed_articles[0], None, mock_pubmed_articles[1]]
+        result = list(iter_map_pubmed_to_zotero(articles, on_error=lambda article, e: failures.append(article)))
+
+        assert [item["title"] for item in result] == [a["title"] for a in mock_pubmed_articles[:2]]
+        assert failures == [None]
+
+    def test_iter_map_raises_without_on_error(self):
+        """Test mapping errors propagate when no on_error is given."""
+        from zotero_mcp.infrastructure.mappers.pubmed_mapper import iter_map_pubmed_to_zotero
+
+        with pytest.raises(AttributeError):
+            list(iter_map_pubmed_to_zotero([None]))
+
+
 class TestExtractPmidFromZoteroItem:
     """Test extract_pmid_from_zotero_item function."""
 
@@ -0,0 +1,125 @@
+"""
+Shared fixtures for MCP tool tests.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+
+class _AsyncAttr:
+    """Awaitable callable with AsyncMock-style ``return_value``/``side_effect`` and a call log."""
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        effect = self.side_effect
+        if isinstance(effect, BaseException) or (isinstance(effect, type) and issubclass(effect, BaseException)):
+            raise effect
+        if effect is not None:
+            return effect(*args, **kwargs)
+        return self.return_value
+
+
+class AsyncStub:
+    """
+    Lightweight stand-in for ``AsyncMock()`` as a Zotero client.
+
+    Every attribute is created on first access as an awaitable ``_AsyncAttr``,
+    without AsyncMock's spec and magic-method setup. Use it where a test only
+    sets ``return_value``/``side_effect`` and inspects ``calls``.
+    """
+
+    def __getattr__(self, name):
+        attr = _AsyncAttr()
+        setattr(self, name, attr)
+        return attr
+
+
+class _Capture:
+    """Decorator that stores the decorated function in ``registry`` under ``key`` (or its name)."""
+
+    __slots__ = ("registry", "key")
+
+    def __init__(self, registry: dict, key: str | None):
+        self.registry = registry
+        self.key = key
+
+    def __call__(self, func):
+        self.registry[self.key if self.key is not None else func.__name__] = func
+        return func
+
+
+def _make_tool_capture():
+    """Return ``(tool, registry)``: a stand-in for ``mcp.tool`` and the functions it captures by name."""
+    registry = {}
+
+    def tool():
+        return _Capture(registry, None)
+
+    return tool, registry
+
+
+def _make_resource_capture():
+    """Return ``(resource, registry)``: a stand-in for ``mcp.resource`` and the functions it captures by URI."""
+    registry = {}
+
+    def resource(uri):
+        return _Capture(registry, uri)
+
+    return resource, registry
+
+
+@pytest.fixture(scope="session")
+def tool_capture():
+    """
+    Factory for capturing registered tools.
+
+    Usage: ``mock_mcp.tool, registered_tools = tool_capture()``.
+    """
+    return _make_tool_capture
+
+
+@pytest.fixture(scope="session")
+def resource_capture():
+    """
+    Factory for capturing registered resources.
+
+    Usage: ``mock_mcp.resource, registered_funcs = resource_capture()``.
+    """
+    return _make_resource_capture
+
+
+@pytest.fixture
+def async_stub():
+    """Provide a fresh AsyncStub client."""
+    return AsyncStub()
+
+
+@pytest.fixture(scope="session")
+def _shared_mcp_and_client():
+    """Build the (mcp, client) mock pair once per session (per xdist worker)."""
+    mcp = MagicMock()
+    mcp.tool = lambda: (lambda func: func)
+    return mcp, MagicMock()
+
+
+@pytest.fixture
+def mock_mcp_and_client(_shared_mcp_and_client):
+    """
+    Provide a reusable (mcp, client) pair for tool registration tests.
+
+    ``mcp.tool()`` returns a pass-through decorator, so registration runs
+    without a real FastMCP server. The client is a plain MagicMock because
+    registration never awaits it. The pair is built once per session and
+    its recorded calls are reset after each test, so tests cannot see each
+    other's interactions regardless of how xdist schedules them. Tests that
+    need to capture registered tools or configure the client should build
+    their own mocks.
+    """
+    yield _shared_mcp_and_client
+    for mock in _shared_mcp_and_client:
+        mock.reset_mock()
@@ -206,7 +206,7 @@ class TestBatchImportFromPubmed:
     @pytest.mark.asyncio
     @patch("zotero_mcp.infrastructure.mcp.batch_tools.BATCH_IMPORT_AVAILABLE", True)
     @patch("zotero_mcp.infrastructure.mcp.batch_tools.fetch_pubmed_articles")
-    @patch("zotero_mcp.infrastructure.mcp.batch_tools.map_pubmed_to_zotero")
+    @patch("zotero_mcp.infrastructure.mappers.pubmed_mapper.map_pubmed_to_zotero")
     async def test_successful_import(self, mock_map, mock_fetch):
         """Test successful batch import."""
         mock_fetch.return_value = [
@@ -291,6 +291,46 @@ class TestBatchImportFromPubmed:
             assert result["skipped"] == 1
             assert result["added"] == 0
 
+    @pytest.mark.asyncio
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.BATCH_IMPORT_AVAILABLE", True)
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.fetch_pubmed_articles")
+    async def test_skips_duplicate_doi_case_insensitive(self, mock_fetch):
+        """Test that a mixed-case article DOI matches the client's lowercased DOIs."""
+        mock_fetch.return_value = [
+            {"pmid": "12345678", "title": "Test Article", "doi": "10.1234/Test"},
+        ]
+
+        from zotero_mcp.infrastructure.mcp.batch_tools import register_batch_tools
+
+        mock_mcp = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.batch_check_identifiers.return_value = {
+            "existing_pmids": set(),
+            "existing_dois": {"10.1234/test"},
+            "pmid_to_key": {},
+            "doi_to_key": {"10.1234/test": "ABC123"},
+        }
+
+        registered_func = None
+
+        def tool_decorator():
+            def wrapper(func):
+                nonlocal registered_func
+                registered_func = func
+                return func
+
+            return wrapper
+
+        mock_mcp.tool = tool_decorator
+
+        register_batch_tools(mock_mcp, mock_client)
+
+        with block_pubmed_search():
+            result = await registered_func("12345678", skip_duplicates=True)
+        assert result["skipped"] == 1
+        assert "ABC123" in result["skipped_items"][0]["reason"]
+        mock_client.batch_save_items.assert_not_called()
+
 
 class TestBatchImportIntegration:
     """Integration tests for batch import workflow."""
@@ -298,7 +338,7 @@ class TestBatchImportIntegration:
     @pytest.mark.asyncio
     @patch("zotero_mcp.infrastructure.mcp.batch_tools.BATCH_IMPORT_AVAILABLE", True)
     @patch("zotero_mcp.infrastructure.mcp.batch_tools.fetch_pubmed_articles")
-    @patch("zotero_mcp.infrastructure.mcp.batch_tools.map_pubmed_to_zotero")
+    @patch("zotero_mcp.infrastructure.mappers.pubmed_mapper.map_pubmed_to_zotero")
     async def test_full_workflow_with_tags(self, mock_map, mock_fetch):
         """Test full workflow with tags."""
         mock_fetch.return_value = [
@@ -344,3 +384,173 @@ class TestBatchImportIntegration:
                 )
             assert result["success"] is True
             assert result["total"] == 2
+
+    @pytest.mark.asyncio
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.BATCH_IMPORT_AVAILABLE", True)
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.fetch_pubmed_articles")
+    async def test_saves_in_connector_sized_batches(self, mock_fetch):
+        """Test that mapped items are saved in batches of SAVE_BATCH_SIZE."""
+        from zotero_mcp.infrastructure.mcp.batch_tools import SAVE_BATCH_SIZE, register_batch_tools
+
+        total = SAVE_BATCH_SIZE * 2 + 1
+        pmids = [str(10000000 + i) for i in range(total)]
+        mock_fetch.return_value = [{"pmid": pmid, "title": f"Article {pmid}"} for pmid in pmids]
+
+        mock_mcp = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.batch_check_identifiers.return_value = {
+            "existing_pmids": set(),
+            "existing_dois": set(),
+            "pmid_to_key": {},
+            "doi_to_key": {},
+        }
+        mock_client.batch_save_items.side_effect = [{"success": True}, RuntimeError("connector down"), {"success": True}]
+
+        registered_func = None
+
+        def tool_decorator():
+            def wrapper(func):
+                nonlocal registered_func
+                registered_func = func
+                return func
+
+            return wrapper
+
+        mock_mcp.tool = tool_decorator
+
+        register_batch_tools(mock_mcp, mock_client)
+
+        with block_pubmed_search():
+            result = await registered_func(",".join(pmids))
+
+        batch_sizes = [len(call.kwargs["items"]) for call in mock_client.batch_save_items.await_args_list]
+        assert batch_sizes == [SAVE_BATCH_SIZE, SAVE_BATCH_SIZE, 1]
+        assert result["added"] == SAVE_BATCH_SIZE + 1
+        assert result["failed"] == SAVE_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.BATCH_IMPORT_AVAILABLE", True)
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.fetch_pubmed_articles")
+    @patch("zotero_mcp.infrastructure.mappers.pubmed_mapper.map_pubmed_to_zotero")
+    async def test_repeated_pmid_saved_once(self, mock_map, mock_fetch):
+        """Test that a PMID appearing twice in one batch is saved once and the repeat skipped."""
+        article = {"pmid": "11111111", "title": "Article 1"}
+        mock_fetch.return_value = [article, dict(article)]
+        mock_map.return_value = {"itemType": "journalArticle", "title": "Article 1"}
+
+        from zotero_mcp.infrastructure.mcp.batch_tools import register_batch_tools
+
+        mock_mcp = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.batch_check_identifiers.return_value = {
+            "existing_pmids": set(),
+            "existing_dois": set(),
+            "pmid_to_key": {},
+            "doi_to_key": {},
+        }
+        mock_client.batch_save_items.return_value = {"success": True}
+
+        registered_func = None
+
+        def tool_decorator():
+            def wrapper(func):
+                nonlocal registered_func
+                registered_func = func
+                return func
+
+            return wrapper
+
+        mock_mcp.tool = tool_decorator
+
+        register_batch_tools(mock_mcp, mock_client)
+
+        with block_pubmed_search():
+            result = await registered_func("11111111,11111111", tags=["Test"])
+
+        mock_map.assert_called_once()
+        assert result["added"] == 1
+        assert result["skipped"] == 1
+        (saved,) = mock_client.batch_save_items.call_args_list
+        assert len(saved.kwargs["items"]) == 1
+
+    @pytest.mark.asyncio
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.BATCH_IMPORT_AVAILABLE", True)
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.fetch_pubmed_articles")
+    @patch("zotero_mcp.infrastructure.mappers.pubmed_mapper.map_pubmed_to_zotero")
+    async def test_repeated_pmid_kept_without_skip_duplicates(self, mock_map, mock_fetch):
+        """Test that skip_duplicates=False also keeps a PMID repeated in the request."""
+        article = {"pmid": "11111111", "title": "Article 1"}
+        mock_fetch.return_value = [article, dict(article)]
+        mock_map.return_value = {"itemType": "journalArticle", "title": "Article 1"}
+
+        from zotero_mcp.infrastructure.mcp.batch_tools import register_batch_tools
+
+        mock_mcp = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.batch_save_items.return_value = {"success": True}
+
+        registered_func = None
+
+        def tool_decorator():
+            def wrapper(func):
+                nonlocal registered_func
+                registered_func = func
+                return func
+
+            return wrapper
+
+        mock_mcp.tool = tool_decorator
+
+        register_batch_tools(mock_mcp, mock_client)
+
+        with block_pubmed_search():
+            result = await registered_func("11111111,11111111", skip_duplicates=False)
+
+        assert result["added"] == 2
+        assert result["skipped"] == 0
+        mock_client.batch_check_identifiers.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.BATCH_IMPORT_AVAILABLE", True)
+    @patch("zotero_mcp.infrastructure.mcp.batch_tools.fetch_pubmed_articles")
+    @patch("zotero_mcp.infrastructure.mappers.pubmed_mapper.map_pubmed_to_zotero")
+    async def test_mapping_error_reported_per_article(self, mock_map, mock_fetch):
+        """Test that a mapping failure fails only that article and the rest keep their PMIDs."""
+        mock_fetch.return_value = [
+            {"pmid": "11111111", "title": "Article 1"},
+            {"pmid": "22222222", "title": "Article 2"},
+            {"pmid": "33333333", "title": "Article 3"},
+        ]
+        mock_map.side_effect = [
+            {"itemType": "journalArticle", "title": "Article 1"},
+            ValueError("bad date"),
+            {"itemType": "journalArticle", "title": "Article 3"},
+        ]
+
+        from zotero_mcp.infrastructure.mcp.batch_tools import register_batch_tools
+
+        mock_mcp = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.batch_save_items.return_value = {"success": True}
+
+        registered_func = None
+
+        def tool_decorator():
+            def wrapper(func):
+                nonlocal registered_func
+                registered_func = func
+                return func
+
+            return wrapper
+
+        mock_mcp.tool = tool_decorator
+
+        register_batch_tools(mock_mcp, mock_client)
+
+        with block_pubmed_search():
+            result = await registered_func("11111111,22222222,33333333", skip_duplicates=False)
+
+        assert [item["pmid"] for item in result["added_items"]] == ["11111111", "33333333"]
+        (failed,) = result["failed_items"]
+        assert failed["pmid"] == "22222222"
+        assert "bad date" in failed["error"]
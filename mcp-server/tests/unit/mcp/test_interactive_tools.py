@@ -4,60 +4,79 @@ Tests for interactive_tools.py
 Tests the interactive save tools including metadata fetching and elicitation.
 """
 
+import asyncio
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-
-# Functions moved to separate modules after refactoring
-from zotero_mcp.infrastructure.mcp.metadata_fetcher import (
-    fetch_metadata_from_doi as _fetch_metadata_from_doi,
-    merge_metadata as _merge_metadata,
-)
-from zotero_mcp.infrastructure.mcp.collection_utils import (
-    format_collection_options as _format_collection_options,
-    num_to_collection_key as _num_to_collection_key,
-)
-from zotero_mcp.infrastructure.mcp.validation import (
-    normalize_title as _normalize_title,
-    get_required_fields as _get_required_fields,
-    validate_item as _validate_item,
-)
-from zotero_mcp.infrastructure.mcp.interactive_tools import (
-    CollectionChoiceSchema,
-    DuplicateConfirmSchema,
-)
+
+# Modules under test are imported lazily so collecting this file does not
+# pull in the MCP server stack. Helpers live in separate modules after refactoring.
+
+
+@pytest.fixture(scope="module")
+def metadata_fetcher():
+    """Lazily import the metadata_fetcher module."""
+    from zotero_mcp.infrastructure.mcp import metadata_fetcher
+
+    return metadata_fetcher
+
+
+@pytest.fixture(scope="module")
+def collection_utils():
+    """Lazily import the collection_utils module."""
+    from zotero_mcp.infrastructure.mcp import collection_utils
+
+    return collection_utils
+
+
+@pytest.fixture(scope="module")
+def validation():
+    """Lazily import the validation module."""
+    from zotero_mcp.infrastructure.mcp import validation
+
+    return validation
+
+
+@pytest.fixture(scope="module")
+def interactive_tools():
+    """Lazily import the interactive_tools module."""
+    from zotero_mcp.infrastructure.mcp import interactive_tools
+
+    return interactive_tools
 
 
 class TestFetchMetadataFromDoi:
     """Tests for _fetch_metadata_from_doi function."""
 
-    @pytest.mark.asyncio
-    async def test_successful_fetch(self):
-        """Test successful metadata fetch from CrossRef."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "message": {
-                "title": ["Test Article Title"],
-                "DOI": "10.1234/test",
-                "abstract": "<p>Test abstract</p>",
-                "author": [
-                    {"given": "John", "family": "Smith"},
-                    {"given": "Jane", "family": "Doe"},
-                ],
-                "container-title": ["Test Journal"],
-                "published": {"date-parts": [[2024, 1, 15]]},
-                "volume": "10",
-                "issue": "2",
-                "page": "100-110",
-                "URL": "https://example.com/article",
-            }
-        }
+    @pytest.fixture(autouse=True)
+    def empty_doi_cache(self, metadata_fetcher, monkeypatch):
+        """Start every test with an empty DOI cache."""
+        monkeypatch.setattr(metadata_fetcher, "_doi_cache", {})
 
-        with patch(
-            "zotero_mcp.infrastructure.mcp.metadata_fetcher._get_crossref_client",
-            return_value=MagicMock(get=AsyncMock(return_value=mock_response)),
-        ):
-            result = await _fetch_metadata_from_doi("10.1234/test")
+    async def test_successful_fetch(self, metadata_fetcher, httpx_mock):
+        """Test successful metadata fetch from CrossRef."""
+        httpx_mock.add_response(
+            url="https://api.crossref.org/works/10.1234/test",
+            json={
+                "message": {
+                    "title": ["Test Article Title"],
+                    "DOI": "10.1234/test",
+                    "abstract": "<p>Test abstract</p>",
+                    "author": [
+                        {"given": "John", "family": "Smith"},
+                        {"given": "Jane", "family": "Doe"},
+                    ],
+                    "container-title": ["Test Journal"],
+                    "published": {"date-parts": [[2024, 1, 15]]},
+                    "volume": "10",
+                    "issue": "2",
+                    "page": "100-110",
+                    "URL": "https://example.com/article",
+                }
+            },
+        )
+
+        result = await metadata_fetcher.fetch_metadata_from_doi("10.1234/test")
 
         assert result is not None
         assert result["title"] == "Test Article Title"
@@ -70,28 +89,70 @@ class TestFetchMetadataFromDoi:
         assert result["issue"] == "2"
         assert result["pages"] == "100-110"
 
-    @pytest.mark.asyncio
-    async def test_not_found(self):
-        """Test handling of 404 response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-
-        with patch(
-            "zotero_mcp.infrastructure.mcp.metadata_fetcher._get_crossref_client",
-            return_value=MagicMock(get=AsyncMock(return_value=mock_response)),
-        ):
-            result = await _fetch_metadata_from_doi("10.9999/notfound")
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_exception_handling(self):
-        """Test exception handling."""
-        with patch(
-            "zotero_mcp.infrastructure.mcp.metadata_fetcher._get_crossref_client",
-            return_value=MagicMock(get=AsyncMock(side_effect=Exception("Network error"))),
-        ):
-            result = await _fetch_metadata_from_doi("10.1234/test")
+    async def test_concurrent_fetches(self, metadata_fetcher, httpx_mock):
+        """Test success, 404 and network failure resolving concurrently on one loop."""
+        httpx_mock.add_response(
+            url="https://api.crossref.org/works/10.1234/ok",
+            json={"message": {"title": ["Concurrent Article"]}},
+        )
+        httpx_mock.add_response(url="https://api.crossref.org/works/10.1234/missing", status_code=404)
+        httpx_mock.add_exception(
+            httpx.ConnectError("Network error"),
+            url="https://api.crossref.org/works/10.1234/down",
+        )
+
+        ok, missing, down = await asyncio.gather(
+            metadata_fetcher.fetch_metadata_from_doi("10.1234/ok"),
+            metadata_fetcher.fetch_metadata_from_doi("10.1234/missing"),
+            metadata_fetcher.fetch_metadata_from_doi("10.1234/down"),
+        )
+
+        assert ok["title"] == "Concurrent Article"
+        assert missing is None
+        assert down is None
+
+    async def test_repeated_doi_served_from_cache(self, metadata_fetcher, httpx_mock):
+        """Test that a DOI is fetched from CrossRef only once."""
+        httpx_mock.add_response(
+            url="https://api.crossref.org/works/10.1234/cached",
+            json={"message": {"title": ["Cached Article"]}},
+        )
+
+        first = await metadata_fetcher.fetch_metadata_from_doi("10.1234/cached")
+        first["title"] = "Mutated by caller"
+        second = await metadata_fetcher.fetch_metadata_from_doi("10.1234/CACHED")
+
+        assert second["title"] == "Cached Article"
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_failures_are_not_cached(self, metadata_fetcher, httpx_mock):
+        """Test that a failed lookup is retried on the next call."""
+        httpx_mock.add_response(url="https://api.crossref.org/works/10.1234/retry", status_code=503)
+        httpx_mock.add_response(
+            url="https://api.crossref.org/works/10.1234/retry",
+            json={"message": {"title": ["Recovered"]}},
+        )
+
+        assert await metadata_fetcher.fetch_metadata_from_doi("10.1234/retry") is None
+        result = await metadata_fetcher.fetch_metadata_from_doi("10.1234/retry")
+
+        assert result["title"] == "Recovered"
+
+    @pytest.mark.parametrize(
+        "setup",
+        [
+            lambda m: m.add_response(status_code=404),
+            lambda m: m.add_response(status_code=500),
+            lambda m: m.add_exception(httpx.ConnectError("Network error")),
+            lambda m: m.add_exception(httpx.ReadTimeout("Timed out")),
+        ],
+        ids=["not_found", "server_error", "connect_error", "timeout"],
+    )
+    async def test_failure_returns_none(self, metadata_fetcher, httpx_mock, setup):
+        """Test that non-200 responses and transport errors yield None."""
+        setup(httpx_mock)
+
+        result = await metadata_fetcher.fetch_metadata_from_doi("10.9999/notfound")
 
         assert result is None
 
@@ -99,33 +160,33 @@ class TestFetchMetadataFromDoi:
 class TestMergeMetadata:
     """Tests for _merge_metadata function."""
 
-    def test_user_data_takes_priority(self):
+    def test_user_data_takes_priority(self, metadata_fetcher):
         """Test that user-provided data takes priority."""
         user_input = {"title": "User Title", "itemType": "journalArticle"}
         fetched = {"title": "Fetched Title", "abstract": "Fetched Abstract"}
 
-        result = _merge_metadata(user_input, fetched)
+        result = metadata_fetcher.merge_metadata(user_input, fetched)
 
         assert result["title"] == "User Title"
         assert result["abstract"] == "Fetched Abstract"
 
-    def test_fetched_fills_gaps(self):
+    def test_fetched_fills_gaps(self, metadata_fetcher):
         """Test that fetched data fills missing fields."""
         user_input = {"title": "User Title"}
         fetched = {"title": "Fetched Title", "abstractNote": "Abstract", "DOI": "10.1234/test"}
 
-        result = _merge_metadata(user_input, fetched)
+        result = metadata_fetcher.merge_metadata(user_input, fetched)
 
         assert result["title"] == "User Title"
         assert result["abstractNote"] == "Abstract"
         assert result["DOI"] == "10.1234/test"
 
-    def test_empty_user_values_ignored(self):
+    def test_empty_user_values_ignored(self, metadata_fetcher):
         """Test that empty user values don't override fetched."""
         user_input = {"title": "", "abstract": None, "tags": []}
         fetched = {"title": "Fetched Title", "abstract": "Fetched Abstract", "tags": ["tag1"]}
 
-        result = _merge_metadata(user_input, fetched)
+        result = metadata_fetcher.merge_metadata(user_input, fetched)
 
         assert result["title"] == "Fetched Title"
         assert result["abstract"] == "Fetched Abstract"
@@ -135,14 +196,14 @@ class TestMergeMetadata:
 class TestFormatCollectionOptions:
     """Tests for _format_collection_options function."""
 
-    def test_basic_formatting(self):
+    def test_basic_formatting(self, collection_utils):
         """Test basic collection formatting."""
         collections = [
             {"key": "ABC123", "name": "Collection A", "itemCount": 10},
             {"key": "DEF456", "name": "Collection B", "itemCount": 5},
         ]
 
-        text, key_to_num = _format_collection_options(collections)
+        text, key_to_num = collection_utils.format_collection_options(collections)
 
         assert "Collection A" in text
         assert "Collection B" in text
@@ -150,7 +211,7 @@ class TestFormatCollectionOptions:
         assert key_to_num["ABC123"] == 1
         assert key_to_num["DEF456"] == 2
 
-    def test_with_suggestions(self):
+    def test_with_suggestions(self, collection_utils):
         """Test formatting with suggestions."""
         collections = [
             {"key": "ABC123", "name": "Collection A", "itemCount": 10},
@@ -159,23 +220,23 @@ class TestFormatCollectionOptions:
             {"key": "ABC123", "name": "Collection A", "score": 85, "reason": "Title match"},
         ]
 
-        text, key_to_num = _format_collection_options(collections, suggestions)
+        text, key_to_num = collection_utils.format_collection_options(collections, suggestions)
 
         assert "Suggested" in text
         assert "85%" in text or "match: 85" in text
 
-    def test_includes_no_collection_option(self):
+    def test_includes_no_collection_option(self, collection_utils):
         """Test that 'no collection' option is included."""
         collections = [{"key": "ABC123", "name": "Test", "itemCount": 5}]
 
-        text, key_to_num = _format_collection_options(collections)
+        text, key_to_num = collection_utils.format_collection_options(collections)
 
         assert "0." in text
         assert "My Library" in text
 
-    def test_empty_collections(self):
+    def test_empty_collections(self, collection_utils):
         """Test handling empty collections."""
-        text, key_to_num = _format_collection_options([])
+        text, key_to_num = collection_utils.format_collection_options([])
 
         assert "0." in text  # Should still have no-collection option
         assert key_to_num == {}
@@ -184,102 +245,64 @@ class TestFormatCollectionOptions:
 class TestNumToCollectionKey:
     """Tests for _num_to_collection_key function."""
 
-    def test_valid_number(self):
-        """Test valid number conversion."""
-        key_to_num = {"ABC123": 1, "DEF456": 2}
-
-        assert _num_to_collection_key("1", key_to_num) == "ABC123"
-        assert _num_to_collection_key("2", key_to_num) == "DEF456"
-
-    def test_zero_returns_none(self):
-        """Test that 0 returns None (no collection)."""
-        key_to_num = {"ABC123": 1}
-
-        result = _num_to_collection_key("0", key_to_num)
-
-        assert result is None
-
-    def test_invalid_number(self):
-        """Test invalid number handling."""
-        key_to_num = {"ABC123": 1}
-
-        assert _num_to_collection_key("99", key_to_num) is None
-        assert _num_to_collection_key("-1", key_to_num) is None
-
-    def test_non_numeric_input(self):
-        """Test non-numeric input handling."""
-        key_to_num = {"ABC123": 1}
-
-        assert _num_to_collection_key("abc", key_to_num) is None
-        assert _num_to_collection_key("", key_to_num) is None
-
-    def test_whitespace_handling(self):
-        """Test whitespace is stripped."""
-        key_to_num = {"ABC123": 1}
-
-        assert _num_to_collection_key("  1  ", key_to_num) == "ABC123"
+    @pytest.mark.parametrize(
+        ("num", "expected"),
+        [
+            ("1", "ABC123"),
+            ("2", "DEF456"),
+            ("0", None),  # 0 means "no collection"
+            ("99", None),
+            ("-1", None),
+            ("abc", None),
+            ("", None),
+            ("  1  ", "ABC123"),
+        ],
+    )
+    def test_num_to_collection_key(self, collection_utils, num, expected):
+        """Test number-to-key conversion, including invalid input and whitespace."""
+        assert collection_utils.num_to_collection_key(num, {"ABC123": 1, "DEF456": 2}) == expected
 
 
 class TestNormalizeTitle:
     """Tests for _normalize_title function."""
 
-    def test_basic_normalization(self):
-        """Test basic title normalization."""
-        assert _normalize_title("Hello World") == "hello world"
-
-    def test_punctuation_removal(self):
-        """Test punctuation removal."""
-        assert _normalize_title("Hello, World!") == "hello world"
-
-    def test_empty_string(self):
-        """Test empty string."""
-        assert _normalize_title("") == ""
-
-    def test_none_handling(self):
-        """Test None handling."""
-        assert _normalize_title(None) == ""
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            ("Hello World", "hello world"),
+            ("Hello, World!", "hello world"),
+            ("", ""),
+            (None, ""),
+        ],
+    )
+    def test_normalize_title(self, validation, title, expected):
+        """Test lowercasing, punctuation removal, and empty/None handling."""
+        assert validation.normalize_title(title) == expected
 
 
 class TestGetRequiredFields:
     """Tests for _get_required_fields function."""
 
-    def test_journal_article(self):
-        """Test required fields for journal article."""
-        fields = _get_required_fields("journalArticle")
-        assert "title" in fields
-        assert "creators" in fields
-
-    def test_book(self):
-        """Test required fields for book."""
-        fields = _get_required_fields("book")
-        assert "title" in fields
-        assert "creators" in fields
-
-    def test_book_section(self):
-        """Test required fields for book section."""
-        fields = _get_required_fields("bookSection")
-        assert "bookTitle" in fields
-
-    def test_thesis(self):
-        """Test required fields for thesis."""
-        fields = _get_required_fields("thesis")
-        assert "university" in fields
-
-    def test_webpage(self):
-        """Test required fields for webpage."""
-        fields = _get_required_fields("webpage")
-        assert "url" in fields
-
-    def test_unknown_type(self):
-        """Test unknown type returns minimal fields."""
-        fields = _get_required_fields("unknown")
-        assert "title" in fields
+    @pytest.mark.parametrize(
+        ("item_type", "expected_fields"),
+        [
+            ("journalArticle", {"title", "creators"}),
+            ("book", {"title", "creators"}),
+            ("bookSection", {"bookTitle"}),
+            ("thesis", {"university"}),
+            ("webpage", {"url"}),
+            ("unknown", {"title"}),  # unknown types fall back to minimal fields
+        ],
+    )
+    def test_required_fields(self, validation, item_type, expected_fields):
+        """Test required fields per item type."""
+        assert expected_fields <= set(validation.get_required_fields(item_type))
 
 
 class TestValidateItem:
     """Tests for _validate_item function."""
 
-    def test_valid_journal_article(self):
+    def test_valid_journal_article(self, validation):
         """Test validation of valid journal article."""
         item = {
             "itemType": "journalArticle",
@@ -289,24 +312,24 @@ class TestValidateItem:
             "DOI": "10.1234/test",
         }
 
-        result = _validate_item(item)
+        result = validation.validate_item(item)
 
         assert result["valid"] is True
         assert result["errors"] == []
 
-    def test_missing_title(self):
+    def test_missing_title(self, validation):
         """Test validation fails for missing title."""
         item = {
             "itemType": "journalArticle",
             "creators": [{"firstName": "John", "lastName": "Smith"}],
         }
 
-        result = _validate_item(item)
+        result = validation.validate_item(item)
 
         assert result["valid"] is False
         assert any("title" in err for err in result["errors"])
 
-    def test_missing_creators(self):
+    def test_missing_creators(self, validation):
         """Test validation fails for missing creators."""
         item = {
             "itemType": "journalArticle",
@@ -314,12 +337,12 @@ class TestValidateItem:
             "creators": [],
         }
 
-        result = _validate_item(item)
+        result = validation.validate_item(item)
 
         assert result["valid"] is False
         assert any("creators" in err for err in result["errors"])
 
-    def test_warnings_for_recommended_fields(self):
+    def test_warnings_for_recommended_fields(self, validation):
         """Test warnings for recommended fields."""
         item = {
             "itemType": "journalArticle",
@@ -328,7 +351,7 @@ class TestValidateItem:
             # Missing publicationTitle and DOI
         }
 
-        result = _validate_item(item)
+        result = validation.validate_item(item)
 
         assert len(result["warnings"]) > 0
 
@@ -336,35 +359,23 @@ class TestValidateItem:
 class TestPydanticSchemas:
     """Tests for Pydantic schemas."""
 
-    def test_collection_choice_schema(self):
+    def test_collection_choice_schema(self, interactive_tools):
         """Test CollectionChoiceSchema."""
-        schema = CollectionChoiceSchema(choice="1")
+        schema = interactive_tools.CollectionChoiceSchema(choice="1")
         assert schema.choice == "1"
 
-    def test_duplicate_confirm_schema(self):
+    def test_duplicate_confirm_schema(self, interactive_tools):
         """Test DuplicateConfirmSchema."""
-        schema = DuplicateConfirmSchema(confirm="yes")
+        schema = interactive_tools.DuplicateConfirmSchema(confirm="yes")
         assert schema.confirm == "yes"
 
 
 class TestRegisterInteractiveSaveTools:
     """Tests for register_interactive_save_tools function."""
 
-    def test_registration(self):
+    def test_registration(self, interactive_tools, mock_mcp_and_client):
         """Test that tools are registered."""
-        from zotero_mcp.infrastructure.mcp.interactive_tools import register_interactive_save_tools
-
-        mock_mcp = MagicMock()
-        mock_client = MagicMock()
-
-        # Setup mock.tool() decorator
-        def tool_decorator():
-            def wrapper(func):
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
+        mock_mcp, mock_client = mock_mcp_and_client
 
         # Should complete without error
-        register_interactive_save_tools(mock_mcp, mock_client)
+        interactive_tools.register_interactive_save_tools(mock_mcp, mock_client)
@@ -4,9 +4,11 @@ Tests for resources.py
 Tests the MCP Resources for Zotero data access.
 """
 
-import pytest
 import json
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock
 
 from zotero_mcp.infrastructure.mcp.resources import (
     _format_creators_short,
@@ -14,135 +16,124 @@ from zotero_mcp.infrastructure.mcp.resources import (
 )
 
 
+@pytest.fixture(scope="module")
+def registered_resources(resource_capture):
+    """Register resources once per module; return (funcs by URI, shared client)."""
+    from zotero_mcp.infrastructure.zotero_client.client import ZoteroClient
+
+    resource, registered_funcs = resource_capture()
+    mock_mcp = SimpleNamespace(resource=resource)
+    mock_client = AsyncMock(spec_set=ZoteroClient)
+    register_resources(mock_mcp, mock_client)
+    return registered_funcs, mock_client
+
+
+@pytest.fixture
+def resources(registered_resources):
+    """Registered resources; the shared client's configuration is reset after each test."""
+    yield registered_resources
+    registered_resources[1].reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def read_resource(resources):
+    """Return a coroutine function that reads a resource by URI and decodes its JSON payload."""
+    registered_funcs, _ = resources
+
+    async def read(uri, *args):
+        return json.loads(await registered_funcs[uri](*args))
+
+    return read
+
+
 class TestFormatCreatorsShort:
     """Tests for _format_creators_short function."""
 
-    def test_single_creator(self):
-        """Test formatting single creator."""
-        creators = [{"firstName": "John", "lastName": "Smith"}]
+    @pytest.mark.parametrize(
+        ("creators", "expected_parts"),
+        [
+            pytest.param([{"firstName": "John", "lastName": "Smith"}], ["John Smith"], id="single"),
+            pytest.param(
+                [{"firstName": "John", "lastName": "Smith"}, {"firstName": "Jane", "lastName": "Doe"}],
+                ["John Smith", "Jane Doe"],
+                id="multiple",
+            ),
+            pytest.param(
+                [{"firstName": c, "lastName": "Author"} for c in "ABCD"],
+                ["et al."],
+                id="more_than_three",
+            ),
+            pytest.param([{"name": "Organization"}], ["Organization"], id="name_only"),
+            pytest.param([{"lastName": "Smith"}], ["Smith"], id="lastname_only"),
+        ],
+    )
+    def test_format_creators_short(self, creators, expected_parts):
+        """Test names, et al. truncation and single-field creators."""
         result = _format_creators_short(creators)
-        assert "John Smith" in result
 
-    def test_multiple_creators(self):
-        """Test formatting multiple creators."""
-        creators = [
-            {"firstName": "John", "lastName": "Smith"},
-            {"firstName": "Jane", "lastName": "Doe"},
-        ]
-        result = _format_creators_short(creators)
-        assert "John Smith" in result
-        assert "Jane Doe" in result
-
-    def test_more_than_three_creators(self):
-        """Test et al. for more than 3 creators."""
-        creators = [
-            {"firstName": "A", "lastName": "Author"},
-            {"firstName": "B", "lastName": "Author"},
-            {"firstName": "C", "lastName": "Author"},
-            {"firstName": "D", "lastName": "Author"},
-        ]
-        result = _format_creators_short(creators)
-        assert "et al." in result
+        for part in expected_parts:
+            assert part in result
 
     def test_empty_creators(self):
         """Test empty creators list."""
-        result = _format_creators_short([])
-        assert result == ""
-
-    def test_creator_with_name_only(self):
-        """Test creator with only name field."""
-        creators = [{"name": "Organization"}]
-        result = _format_creators_short(creators)
-        assert "Organization" in result
+        assert _format_creators_short([]) == ""
 
 
 class TestRegisterResources:
     """Tests for register_resources function."""
 
-    def test_registers_resources(self):
-        """Test that resources are registered."""
-        mock_mcp = MagicMock()
-        mock_client = MagicMock()
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        # Should complete without error
-        register_resources(mock_mcp, mock_client)
+    def test_registers_resources(self, registered_resources):
+        """Test that every expected resource URI is registered."""
+        registered_funcs, _ = registered_resources
+
+        assert set(registered_funcs) == {
+            "zotero://collections",
+            "zotero://collections/tree",
+            "zotero://collections/{key}",
+            "zotero://collections/{key}/items",
+            "zotero://items",
+            "zotero://items/{key}",
+            "zotero://tags",
+            "zotero://searches",
+            "zotero://searches/{key}",
+            "zotero://schema/item-types",
+        }
 
 
 class TestCollectionsResource:
     """Tests for collections resources."""
 
     @pytest.mark.asyncio
-    async def test_list_collections_resource(self):
+    async def test_list_collections_resource(self, resources, read_resource):
         """Test listing collections resource."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_collections.return_value = [
             {"key": "ABC123", "data": {"name": "Test Collection", "numItems": 10}},
         ]
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://collections" in registered_funcs:
-            result = await registered_funcs["zotero://collections"]()
-            data = json.loads(result)
-            assert data["type"] == "collections"
-            assert data["count"] == 1
+        data = await read_resource("zotero://collections")
+        assert data["type"] == "collections"
+        assert data["count"] == 1
 
     @pytest.mark.asyncio
-    async def test_get_collection_tree_resource(self):
+    async def test_get_collection_tree_resource(self, resources, read_resource):
         """Test collection tree resource."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_collection_tree.return_value = [
             {"key": "ABC", "name": "Root", "children": []},
         ]
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://collections/tree" in registered_funcs:
-            result = await registered_funcs["zotero://collections/tree"]()
-            data = json.loads(result)
-            assert data["type"] == "collection_tree"
+        data = await read_resource("zotero://collections/tree")
+        assert data["type"] == "collection_tree"
 
 
 class TestItemsResource:
     """Tests for items resources."""
 
     @pytest.mark.asyncio
-    async def test_list_items_resource(self):
+    async def test_list_items_resource(self, resources, read_resource):
         """Test listing items resource."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_items.return_value = [
             {
                 "key": "ITEM1",
@@ -155,29 +146,13 @@ class TestItemsResource:
             },
         ]
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://items" in registered_funcs:
-            result = await registered_funcs["zotero://items"]()
-            data = json.loads(result)
-            assert data["type"] == "items"
+        data = await read_resource("zotero://items")
+        assert data["type"] == "items"
 
     @pytest.mark.asyncio
-    async def test_get_item_resource(self):
+    async def test_get_item_resource(self, resources, read_resource):
         """Test getting single item resource."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_item.return_value = {
             "key": "ITEM1",
             "data": {
@@ -188,146 +163,67 @@ class TestItemsResource:
             },
         }
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://items/{key}" in registered_funcs:
-            result = await registered_funcs["zotero://items/{key}"]("ITEM1")
-            data = json.loads(result)
-            assert data["type"] == "item"
-            assert data["title"] == "Test Article"
+        data = await read_resource("zotero://items/{key}", "ITEM1")
+        assert data["type"] == "item"
+        assert data["title"] == "Test Article"
 
 
 class TestTagsResource:
     """Tests for tags resource."""
 
     @pytest.mark.asyncio
-    async def test_list_tags_resource(self):
+    async def test_list_tags_resource(self, resources, read_resource):
         """Test listing tags resource."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_tags.return_value = [
             {"tag": "machine learning"},
             {"tag": "AI"},
         ]
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://tags" in registered_funcs:
-            result = await registered_funcs["zotero://tags"]()
-            data = json.loads(result)
-            assert data["type"] == "tags"
-            assert data["count"] == 2
+        data = await read_resource("zotero://tags")
+        assert data["type"] == "tags"
+        assert data["count"] == 2
 
 
 class TestSearchesResource:
     """Tests for saved searches resource."""
 
     @pytest.mark.asyncio
-    async def test_list_searches_resource(self):
+    async def test_list_searches_resource(self, resources, read_resource):
         """Test listing saved searches resource."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_searches.return_value = [
             {"key": "SEARCH1", "data": {"name": "Missing PDF", "conditions": []}},
         ]
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://searches" in registered_funcs:
-            result = await registered_funcs["zotero://searches"]()
-            data = json.loads(result)
-            assert data["type"] == "saved_searches"
+        data = await read_resource("zotero://searches")
+        assert data["type"] == "saved_searches"
 
 
 class TestSchemaResource:
     """Tests for schema resource."""
 
     @pytest.mark.asyncio
-    async def test_get_item_types_resource(self):
+    async def test_get_item_types_resource(self, resources, read_resource):
         """Test getting item types resource."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_item_types.return_value = [
             {"itemType": "journalArticle"},
             {"itemType": "book"},
         ]
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://schema/item-types" in registered_funcs:
-            result = await registered_funcs["zotero://schema/item-types"]()
-            data = json.loads(result)
-            assert data["type"] == "item_types"
+        data = await read_resource("zotero://schema/item-types")
+        assert data["type"] == "item_types"
 
 
 class TestResourceErrorHandling:
     """Tests for error handling in resources."""
 
     @pytest.mark.asyncio
-    async def test_handles_exception(self):
+    async def test_handles_exception(self, resources, read_resource):
         """Test that exceptions are handled gracefully."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        _, mock_client = resources
         mock_client.get_collections.side_effect = Exception("API Error")
 
-        registered_funcs = {}
-
-        def resource_decorator(uri):
-            def wrapper(func):
-                registered_funcs[uri] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.resource = resource_decorator
-
-        register_resources(mock_mcp, mock_client)
-
-        if "zotero://collections" in registered_funcs:
-            result = await registered_funcs["zotero://collections"]()
-            data = json.loads(result)
-            assert "error" in data
+        data = await read_resource("zotero://collections")
+        assert "error" in data
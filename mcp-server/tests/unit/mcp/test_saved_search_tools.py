@@ -4,8 +4,10 @@ Tests for saved_search_tools.py
 Tests the saved search functionality for Zotero Local API.
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 from zotero_mcp.infrastructure.mcp.saved_search_tools import (
     _format_creators,
@@ -13,130 +15,103 @@ from zotero_mcp.infrastructure.mcp.saved_search_tools import (
 )
 
 
+@pytest.fixture(scope="module")
+def registered_saved_search_tools(tool_capture):
+    """Register saved search tools once per module; return (tools by name, shared client)."""
+    from zotero_mcp.infrastructure.zotero_client.client import ZoteroClient
+
+    tool, registered_tools = tool_capture()
+    mock_mcp = SimpleNamespace(tool=tool)
+    mock_client = AsyncMock(spec_set=ZoteroClient)
+    register_saved_search_tools(mock_mcp, mock_client)
+    return registered_tools, mock_client
+
+
+@pytest.fixture
+def saved_search_tools(registered_saved_search_tools):
+    """Registered tools; the shared client's configuration is reset after each test."""
+    yield registered_saved_search_tools
+    registered_saved_search_tools[1].reset_mock(return_value=True, side_effect=True)
+
+
 class TestFormatCreators:
     """Tests for _format_creators function."""
 
-    def test_single_creator(self):
-        """Test formatting single creator."""
-        creators = [{"firstName": "John", "lastName": "Smith"}]
+    @pytest.mark.parametrize(
+        ("creators", "expected_parts"),
+        [
+            pytest.param([{"firstName": "John", "lastName": "Smith"}], ["John Smith"], id="single"),
+            pytest.param(
+                [{"firstName": "John", "lastName": "Smith"}, {"firstName": "Jane", "lastName": "Doe"}],
+                ["John Smith", "Jane Doe"],
+                id="multiple",
+            ),
+            pytest.param(
+                [{"firstName": c, "lastName": "Author"} for c in "ABCD"],
+                ["et al.", "+1"],
+                id="more_than_three",
+            ),
+            pytest.param([{"name": "Organization Name"}], ["Organization Name"], id="name_only"),
+            pytest.param([{"lastName": "Smith"}], ["Smith"], id="lastname_only"),
+        ],
+    )
+    def test_format_creators(self, creators, expected_parts):
+        """Test names, et al. truncation and single-field creators."""
         result = _format_creators(creators)
-        assert "John Smith" in result
 
-    def test_multiple_creators(self):
-        """Test formatting multiple creators."""
-        creators = [
-            {"firstName": "John", "lastName": "Smith"},
-            {"firstName": "Jane", "lastName": "Doe"},
-        ]
-        result = _format_creators(creators)
-        assert "John Smith" in result
-        assert "Jane Doe" in result
-
-    def test_more_than_three_creators(self):
-        """Test et al. for more than 3 creators."""
-        creators = [
-            {"firstName": "A", "lastName": "Author"},
-            {"firstName": "B", "lastName": "Author"},
-            {"firstName": "C", "lastName": "Author"},
-            {"firstName": "D", "lastName": "Author"},
-        ]
-        result = _format_creators(creators)
-        assert "et al." in result
-        assert "+1" in result
+        for part in expected_parts:
+            assert part in result
 
     def test_empty_creators(self):
         """Test empty creators list."""
-        result = _format_creators([])
-        assert result == ""
-
-    def test_creator_with_name_only(self):
-        """Test creator with only name field."""
-        creators = [{"name": "Organization Name"}]
-        result = _format_creators(creators)
-        assert "Organization Name" in result
-
-    def test_creator_with_lastname_only(self):
-        """Test creator with only lastName."""
-        creators = [{"lastName": "Smith"}]
-        result = _format_creators(creators)
-        assert "Smith" in result
+        assert _format_creators([]) == ""
 
 
 class TestRegisterSavedSearchTools:
     """Tests for register_saved_search_tools function."""
 
-    def test_registers_tools(self):
-        """Test that tools are registered."""
-        mock_mcp = MagicMock()
-        mock_client = MagicMock()
-
-        def tool_decorator():
-            def wrapper(func):
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
+    def test_registers_tools(self, registered_saved_search_tools):
+        """Test that every saved search tool is registered."""
+        registered_tools, _ = registered_saved_search_tools
 
-        # Should complete without error
-        register_saved_search_tools(mock_mcp, mock_client)
+        assert set(registered_tools) == {"list_saved_searches", "run_saved_search", "get_saved_search_details"}
 
 
 class TestListSavedSearches:
     """Tests for list_saved_searches tool."""
 
     @pytest.mark.asyncio
-    async def test_list_searches(self):
+    async def test_list_searches(self, saved_search_tools):
         """Test listing saved searches."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        registered_tools, mock_client = saved_search_tools
         mock_client.get_searches.return_value = [
             {"key": "ABC123", "data": {"name": "Test Search", "conditions": []}},
         ]
 
-        registered_func = None
+        result = await registered_tools["list_saved_searches"]()
 
-        def tool_decorator():
-            def wrapper(func):
-                nonlocal registered_func
-                registered_func = func
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
-
-        register_saved_search_tools(mock_mcp, mock_client)
-
-        # Find list_saved_searches function
-        # In real implementation, we'd need to capture the specific function
+        assert result["count"] == 1
+        assert result["searches"][0] == {"key": "ABC123", "name": "Test Search", "conditions": []}
 
     @pytest.mark.asyncio
-    async def test_list_searches_empty(self):
+    async def test_list_searches_empty(self, saved_search_tools):
         """Test listing when no searches exist."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        registered_tools, mock_client = saved_search_tools
         mock_client.get_searches.return_value = []
 
-        def tool_decorator():
-            def wrapper(func):
-                return func
+        result = await registered_tools["list_saved_searches"]()
 
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
-
-        register_saved_search_tools(mock_mcp, mock_client)
+        assert result["count"] == 0
+        assert result["searches"] == []
 
 
 class TestRunSavedSearch:
     """Tests for run_saved_search tool."""
 
     @pytest.mark.asyncio
-    async def test_run_by_key(self):
+    async def test_run_by_key(self, saved_search_tools):
         """Test running search by key."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        registered_tools, mock_client = saved_search_tools
         mock_client.get_search.return_value = {
             "key": "ABC123",
             "data": {"name": "Test", "conditions": []},
@@ -145,63 +120,48 @@ class TestRunSavedSearch:
             {"key": "ITEM1", "data": {"title": "Test Item", "itemType": "journalArticle"}},
         ]
 
-        def tool_decorator():
-            def wrapper(func):
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
+        result = await registered_tools["run_saved_search"](search_key="ABC123")
 
-        register_saved_search_tools(mock_mcp, mock_client)
+        assert result["success"] is True
+        assert result["search"]["name"] == "Test"
+        assert result["count"] == 1
+        assert result["items"][0]["title"] == "Test Item"
 
     @pytest.mark.asyncio
-    async def test_run_by_name(self):
+    async def test_run_by_name(self, saved_search_tools):
         """Test running search by name."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        registered_tools, mock_client = saved_search_tools
         mock_client.find_search_by_name.return_value = {
             "key": "ABC123",
             "data": {"name": "Missing PDF", "conditions": []},
         }
         mock_client.execute_search.return_value = []
 
-        def tool_decorator():
-            def wrapper(func):
-                return func
+        result = await registered_tools["run_saved_search"](search_name="Missing PDF")
 
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
-
-        register_saved_search_tools(mock_mcp, mock_client)
+        assert result["success"] is True
+        assert result["search"]["key"] == "ABC123"
+        mock_client.execute_search.assert_awaited_once_with("ABC123", limit=50)
 
     @pytest.mark.asyncio
-    async def test_search_not_found(self):
+    async def test_search_not_found(self, saved_search_tools):
         """Test handling when search not found."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        registered_tools, mock_client = saved_search_tools
         mock_client.find_search_by_name.return_value = None
 
-        def tool_decorator():
-            def wrapper(func):
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
+        result = await registered_tools["run_saved_search"](search_name="Nope")
 
-        register_saved_search_tools(mock_mcp, mock_client)
+        assert result["success"] is False
+        assert "not found" in result["error"]
 
 
 class TestGetSavedSearchDetails:
     """Tests for get_saved_search_details tool."""
 
     @pytest.mark.asyncio
-    async def test_get_details(self):
+    async def test_get_details(self, saved_search_tools):
         """Test getting search details."""
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        registered_tools, mock_client = saved_search_tools
         mock_client.get_search.return_value = {
             "key": "ABC123",
             "data": {
@@ -210,31 +170,20 @@ class TestGetSavedSearchDetails:
             },
         }
 
-        def tool_decorator():
-            def wrapper(func):
-                return func
+        result = await registered_tools["get_saved_search_details"]("ABC123")
 
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
-
-        register_saved_search_tools(mock_mcp, mock_client)
+        assert result["found"] is True
+        assert result["search"]["conditions"][0]["condition"] == "title"
 
     @pytest.mark.asyncio
-    async def test_search_not_found(self):
+    async def test_search_not_found(self, saved_search_tools):
         """Test handling when search not found."""
         from zotero_mcp.infrastructure.zotero_client.client import ZoteroAPIError
 
-        mock_mcp = MagicMock()
-        mock_client = AsyncMock()
+        registered_tools, mock_client = saved_search_tools
         mock_client.get_search.side_effect = ZoteroAPIError("Not found", 404)
 
-        def tool_decorator():
-            def wrapper(func):
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
+        result = await registered_tools["get_saved_search_details"]("MISSING")
 
-        register_saved_search_tools(mock_mcp, mock_client)
+        assert result["found"] is False
+        assert "not found" in result["error"]
@@ -4,8 +4,10 @@ Tests for search_tools.py
 Tests the integrated PubMed search with Zotero filtering functionality.
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 from zotero_mcp.infrastructure.mcp.search_helpers import (
     normalize_title,
@@ -21,37 +23,113 @@ from zotero_mcp.infrastructure.mcp.search_tools import (
 )
 
 
-class TestNormalizeTitle:
-    """Tests for normalize_title function."""
-
-    def test_basic_normalization(self):
-        """Test basic title normalization."""
-        assert normalize_title("Hello World") == "hello world"
-
-    def test_removes_punctuation(self):
-        """Test that punctuation is removed."""
-        assert normalize_title("Hello, World!") == "hello world"
-
-    def test_collapses_whitespace(self):
-        """Test that multiple spaces are collapsed."""
-        assert normalize_title("Hello    World") == "hello world"
+@pytest.fixture(scope="module")
+def registered_search_tools(tool_capture):
+    """
+    Return a function that registers search tools once per configuration.
+
+    Called as ``registered_search_tools(pubmed_available, enable_pubmed_bridge_tools)``;
+    each (availability, bridge flag) combination is registered at most once per module
+    and its tools are returned by name.
+    """
+    from zotero_mcp.infrastructure.mcp.search_tools import register_search_tools
+    from zotero_mcp.infrastructure.zotero_client.client import ZoteroClient
+
+    registries: dict[tuple[bool, bool], dict] = {}
+
+    def get(pubmed_available: bool, enable_pubmed_bridge_tools: bool = False) -> dict:
+        key = (pubmed_available, enable_pubmed_bridge_tools)
+        if key not in registries:
+            tool, registered_tools = tool_capture()
+            mock_mcp = SimpleNamespace(tool=tool)
+            with patch(
+                "zotero_mcp.infrastructure.mcp.search_tools.pubmed_integration_available",
+                return_value=pubmed_available,
+            ):
+                register_search_tools(
+                    mock_mcp,
+                    AsyncMock(spec_set=ZoteroClient),
+                    enable_pubmed_bridge_tools=enable_pubmed_bridge_tools,
+                )
+            registries[key] = registered_tools
+        return registries[key]
+
+    return get
+
+
+# Library payloads for get_owned_identifiers, shared by several tests. The tuples
+# only fix the sequence; the dicts inside are ordinary dicts, so treat them as read-only.
+_DOI_ITEMS = (
+    {"data": {"DOI": "10.1234/test1", "title": "Test 1"}},
+    {"data": {"DOI": "10.5678/TEST2", "title": "Test 2"}},
+)
+_EXTRA_PMID_ITEMS = ({"data": {"extra": "PMID: 12345678", "title": "Test"}},)
+_NATIVE_PMID_ITEMS = ({"data": {"PMID": "38353755", "title": "Test Native PMID"}},)
+_TITLE_ITEMS = ({"data": {"title": "Hello World!"}},)
+_EMPTY_OWNED = {"dois": set(), "pmids": set(), "titles": set()}
+
+# (input title, normalized title) pairs for normalize_title
+_NORMALIZE_CASES = (
+    ("Hello World", "hello world"),
+    ("Hello, World!", "hello world"),
+    ("Hello    World", "hello world"),
+    ("  Hello World  ", "hello world"),
+    ("", ""),
+    (None, ""),
+    ("Title: A Study of X & Y (2024)", "title a study of x y 2024"),
+)
+_NORMALIZE_IDS = (
+    "basic",
+    "punctuation",
+    "collapses_whitespace",
+    "strips_whitespace",
+    "empty",
+    "none",
+    "special_characters",
+)
 
-    def test_strips_whitespace(self):
-        """Test that leading/trailing whitespace is stripped."""
-        assert normalize_title("  Hello World  ") == "hello world"
+# Search results for format_search_results, shared (read-only) like the payloads above.
+_BASIC_RESULTS = (
+    {
+        "pmid": "12345678",
+        "title": "Test Article",
+        "authors": ["Smith J", "Jones A"],
+        "journal": "Test Journal",
+        "year": "2024",
+        "doi": "10.1234/test",
+    },
+)
+_MANY_AUTHORS_RESULTS = (
+    {
+        "pmid": "12345678",
+        "title": "Test",
+        "authors": ["Smith J", "Jones A", "Brown B", "White W"],
+        "journal": "Journal",
+        "year": "2024",
+    },
+)
+_NO_AUTHORS_RESULTS = (
+    {
+        "pmid": "12345678",
+        "title": "Test",
+        "authors": [],
+        "journal": "Journal",
+        "year": "2024",
+    },
+)
+_OWNED_RESULTS = (
+    {"pmid": "1", "title": "Owned", "_is_owned": True, "authors": [], "journal": "", "year": ""},
+    {"pmid": "2", "title": "New", "_is_owned": False, "authors": [], "journal": "", "year": ""},
+)
 
-    def test_empty_string(self):
-        """Test empty string handling."""
-        assert normalize_title("") == ""
 
-    def test_none_handling(self):
-        """Test None handling."""
-        assert normalize_title(None) == ""
+class TestNormalizeTitle:
+    """Tests for normalize_title function."""
 
-    def test_special_characters(self):
-        """Test special characters removal."""
-        result = normalize_title("Title: A Study of X & Y (2024)")
-        assert result == "title a study of x y 2024"
+    @pytest.mark.parametrize(("title", "expected"), _NORMALIZE_CASES, ids=_NORMALIZE_IDS)
+    def test_normalize_title(self, title, expected):
+        """Test lowercasing, punctuation removal and whitespace handling."""
+        assert normalize_title(title) == expected
 
     def test_unicode_characters(self):
         """Test unicode characters handling."""
@@ -64,38 +142,22 @@ class TestNormalizeTitle:
 class TestExtractPmidFromExtra:
     """Tests for extract_pmid_from_extra function."""
 
-    def test_extract_standard_format(self):
-        """Test extraction from standard format."""
-        assert extract_pmid_from_extra("PMID: 12345678") == "12345678"
-
-    def test_extract_lowercase(self):
-        """Test case-insensitive extraction."""
-        assert extract_pmid_from_extra("pmid: 12345678") == "12345678"
-
-    def test_extract_no_space(self):
-        """Test extraction without space after colon."""
-        assert extract_pmid_from_extra("PMID:12345678") == "12345678"
-
-    def test_extract_with_other_fields(self):
-        """Test extraction when other fields present."""
-        extra = "PMID: 12345678\nDOI: 10.1234/test"
-        assert extract_pmid_from_extra(extra) == "12345678"
-
-    def test_no_pmid(self):
-        """Test when no PMID present."""
-        assert extract_pmid_from_extra("DOI: 10.1234/test") is None
-
-    def test_empty_string(self):
-        """Test empty string."""
-        assert extract_pmid_from_extra("") is None
-
-    def test_none_input(self):
-        """Test None input."""
-        assert extract_pmid_from_extra(None) is None
-
-    def test_extract_mixed_case(self):
-        """Test mixed case format."""
-        assert extract_pmid_from_extra("Pmid: 12345678") == "12345678"
+    @pytest.mark.parametrize(
+        ("extra", "expected"),
+        [
+            pytest.param("PMID: 12345678", "12345678", id="standard"),
+            pytest.param("pmid: 12345678", "12345678", id="lowercase"),
+            pytest.param("Pmid: 12345678", "12345678", id="mixed_case"),
+            pytest.param("PMID:12345678", "12345678", id="no_space"),
+            pytest.param("PMID: 12345678\nDOI: 10.1234/test", "12345678", id="with_other_fields"),
+            pytest.param("DOI: 10.1234/test", None, id="no_pmid"),
+            pytest.param("", None, id="empty"),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    def test_extract_pmid_from_extra(self, extra, expected):
+        """Test PMID extraction from the extra field."""
+        assert extract_pmid_from_extra(extra) == expected
 
 
 class TestExtractPmidFromItem:
@@ -126,155 +188,128 @@ class TestExtractPmidFromItem:
         assert extract_pmid_from_item(data) is None
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestGetOwnedIdentifiers:
-    """Tests for get_owned_identifiers function."""
+    """Tests for get_owned_identifiers function (sharing one event loop)."""
 
-    @pytest.mark.asyncio
-    async def test_extracts_dois(self):
+    async def test_extracts_dois(self, async_stub):
         """Test DOI extraction from items."""
-        mock_client = AsyncMock()
-        mock_client.get_items.return_value = [
-            {"data": {"DOI": "10.1234/test1", "title": "Test 1"}},
-            {"data": {"DOI": "10.5678/TEST2", "title": "Test 2"}},
-        ]
+        mock_client = async_stub
+        mock_client.get_items.return_value = _DOI_ITEMS
 
         owned = await get_owned_identifiers(mock_client)
 
         assert "10.1234/test1" in owned["dois"]
         assert "10.5678/test2" in owned["dois"]  # Should be lowercase
 
-    @pytest.mark.asyncio
-    async def test_extracts_pmids(self):
+    async def test_extracts_pmids(self, async_stub):
         """Test PMID extraction from extra field."""
-        mock_client = AsyncMock()
-        mock_client.get_items.return_value = [
-            {"data": {"extra": "PMID: 12345678", "title": "Test"}},
-        ]
+        mock_client = async_stub
+        mock_client.get_items.return_value = _EXTRA_PMID_ITEMS
 
         owned = await get_owned_identifiers(mock_client)
 
         assert "12345678" in owned["pmids"]
 
-    @pytest.mark.asyncio
-    async def test_extracts_native_pmids(self):
+    async def test_extracts_native_pmids(self, async_stub):
         """Test PMID extraction from native PMID field (Zotero 6+)."""
-        mock_client = AsyncMock()
-        mock_client.get_items.return_value = [
-            {"data": {"PMID": "38353755", "title": "Test Native PMID"}},
-        ]
+        mock_client = async_stub
+        mock_client.get_items.return_value = _NATIVE_PMID_ITEMS
 
         owned = await get_owned_identifiers(mock_client)
 
         assert "38353755" in owned["pmids"]
 
-    @pytest.mark.asyncio
-    async def test_extracts_titles(self):
+    async def test_extracts_titles(self, async_stub):
         """Test title extraction and normalization."""
-        mock_client = AsyncMock()
-        mock_client.get_items.return_value = [
-            {"data": {"title": "Hello World!"}},
-        ]
+        mock_client = async_stub
+        mock_client.get_items.return_value = _TITLE_ITEMS
 
         owned = await get_owned_identifiers(mock_client)
 
         assert "hello world" in owned["titles"]
 
-    @pytest.mark.asyncio
-    async def test_handles_empty_items(self):
+    async def test_handles_empty_items(self, async_stub):
         """Test handling empty item list."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_items.return_value = []
 
         owned = await get_owned_identifiers(mock_client)
 
-        assert owned["dois"] == set()
-        assert owned["pmids"] == set()
-        assert owned["titles"] == set()
+        assert owned == _EMPTY_OWNED
 
-    @pytest.mark.asyncio
-    async def test_handles_exception(self):
+    async def test_handles_exception(self, async_stub):
         """Test exception handling."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_items.side_effect = Exception("API Error")
 
         owned = await get_owned_identifiers(mock_client)
 
-        assert owned["dois"] == set()
-        assert owned["pmids"] == set()
-        assert owned["titles"] == set()
+        assert owned == _EMPTY_OWNED
 
-    @pytest.mark.asyncio
-    async def test_respects_limit(self):
+    async def test_respects_limit(self, async_stub):
         """Test that limit parameter is passed."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_items.return_value = []
 
         await get_owned_identifiers(mock_client, limit=100)
 
-        mock_client.get_items.assert_called_once_with(limit=100)
+        assert mock_client.get_items.calls == [((), {"limit": 100})]
 
 
 class TestIsOwned:
     """Tests for is_owned function."""
 
-    def test_doi_match(self):
-        """Test DOI matching."""
-        article = {"doi": "10.1234/test"}
-        owned = {"dois": {"10.1234/test"}, "pmids": set(), "titles": set()}
-
-        owned_flag, reason = is_owned(article, owned)
-
-        assert owned_flag is True
-        assert "DOI" in reason
-
-    def test_pmid_match(self):
-        """Test PMID matching."""
-        article = {"pmid": "12345678"}
-        owned = {"dois": set(), "pmids": {"12345678"}, "titles": set()}
-
-        owned_flag, reason = is_owned(article, owned)
-
-        assert owned_flag is True
-        assert "PMID" in reason
-
-    def test_title_fuzzy_match(self):
-        """Test fuzzy title matching."""
-        article = {"title": "A study of machine learning"}
-        owned = {"dois": set(), "pmids": set(), "titles": {"a study of machine learning"}}
-
-        owned_flag, reason = is_owned(article, owned)
-
-        assert owned_flag is True
-        assert "Title" in reason
-
-    def test_title_similar_match(self):
-        """Test similar title matching."""
-        article = {"title": "A Study of Machine Learning in Healthcare"}
-        owned = {"dois": set(), "pmids": set(), "titles": {"a study of machine learning in health"}}
-
-        owned_flag, reason = is_owned(article, owned)
-
-        # Should match due to high similarity
-        assert owned_flag is True or owned_flag is False  # Depends on threshold
-
-    def test_not_owned(self):
-        """Test article that is not owned."""
-        article = {"doi": "10.9999/new", "pmid": "99999999", "title": "Brand New Article"}
-        owned = {"dois": {"10.1234/old"}, "pmids": {"12345678"}, "titles": {"old article"}}
-
-        owned_flag, reason = is_owned(article, owned)
-
-        assert owned_flag is False
-        assert reason == ""
-
-    def test_empty_owned(self):
-        """Test with empty owned set."""
-        article = {"title": "Any Article"}
-        owned = {"dois": set(), "pmids": set(), "titles": set()}
-
+    @pytest.mark.parametrize(
+        ("article", "owned", "expected", "reason_fragment"),
+        [
+            pytest.param(
+                {"doi": "10.1234/test"},
+                {**_EMPTY_OWNED, "dois": {"10.1234/test"}},
+                True,
+                "DOI",
+                id="doi_match",
+            ),
+            pytest.param(
+                {"pmid": "12345678"},
+                {**_EMPTY_OWNED, "pmids": {"12345678"}},
+                True,
+                "PMID",
+                id="pmid_match",
+            ),
+            pytest.param(
+                {"title": "A study of machine learning"},
+                {**_EMPTY_OWNED, "titles": {"a study of machine learning"}},
+                True,
+                "Title",
+                id="title_exact_match",
+            ),
+            pytest.param(
+                {"title": "A Study of Machine Learning in Healthcare"},
+                {**_EMPTY_OWNED, "titles": {"a study of machine learning in health"}},
+                True,
+                "Title",
+                id="title_similar_match",
+            ),
+            pytest.param(
+                {"doi": "10.9999/new", "pmid": "99999999", "title": "Brand New Article"},
+                {"dois": {"10.1234/old"}, "pmids": {"12345678"}, "titles": {"old article"}},
+                False,
+                "",
+                id="not_owned",
+            ),
+            pytest.param({"title": "Any Article"}, _EMPTY_OWNED, False, "", id="empty_owned"),
+        ],
+    )
+    def test_is_owned(self, article, owned, expected, reason_fragment):
+        """Test DOI, PMID and title matching; unmatched articles have no reason."""
         owned_flag, reason = is_owned(article, owned)
 
-        assert owned_flag is False
+        assert owned_flag is expected
+        if reason_fragment:
+            assert reason_fragment in reason
+        else:
+            assert reason == ""
 
 
 class TestFormatSearchResults:
@@ -287,18 +322,7 @@ class TestFormatSearchResults:
 
     def test_basic_formatting(self):
         """Test basic result formatting."""
-        results = [
-            {
-                "pmid": "12345678",
-                "title": "Test Article",
-                "authors": ["Smith J", "Jones A"],
-                "journal": "Test Journal",
-                "year": "2024",
-                "doi": "10.1234/test",
-            }
-        ]
-
-        result = format_search_results(results)
+        result = format_search_results(_BASIC_RESULTS)
 
         assert "Test Article" in result
         assert "12345678" in result
@@ -309,44 +333,19 @@ class TestFormatSearchResults:
 
     def test_many_authors(self):
         """Test author formatting with many authors."""
-        results = [
-            {
-                "pmid": "12345678",
-                "title": "Test",
-                "authors": ["Smith J", "Jones A", "Brown B", "White W"],
-                "journal": "Journal",
-                "year": "2024",
-            }
-        ]
-
-        result = format_search_results(results)
+        result = format_search_results(_MANY_AUTHORS_RESULTS)
 
         assert "Smith J et al." in result
 
     def test_no_authors(self):
         """Test formatting with no authors."""
-        results = [
-            {
-                "pmid": "12345678",
-                "title": "Test",
-                "authors": [],
-                "journal": "Journal",
-                "year": "2024",
-            }
-        ]
-
-        result = format_search_results(results)
+        result = format_search_results(_NO_AUTHORS_RESULTS)
 
         assert "Unknown" in result
 
     def test_show_owned_markers(self):
         """Test owned markers in output."""
-        results = [
-            {"pmid": "1", "title": "Owned", "_is_owned": True, "authors": [], "journal": "", "year": ""},
-            {"pmid": "2", "title": "New", "_is_owned": False, "authors": [], "journal": "", "year": ""},
-        ]
-
-        result = format_search_results(results, show_owned=True)
+        result = format_search_results(_OWNED_RESULTS, show_owned=True)
 
         assert "📚" in result
         assert "🆕" in result
@@ -360,95 +359,49 @@ class TestIsSearchToolsAvailable:
         result = is_search_tools_available()
         assert isinstance(result, bool)
 
+    def test_rechecks_after_unavailable(self):
+        """Test that a failed probe is not remembered, so a later call can succeed."""
+        with patch(
+            "zotero_mcp.infrastructure.mcp.search_tools.pubmed_integration_available",
+            return_value=False,
+        ) as probe:
+            assert is_search_tools_available() is False
+
+            probe.return_value = True
+            assert is_search_tools_available() is True
+            assert probe.call_count == 2
+
 
 class TestRegisterSearchTools:
     """Tests for register_search_tools function."""
 
-    def test_registers_advanced_search_when_pubmed_unavailable(self):
+    def test_registers_advanced_search_when_pubmed_unavailable(self, registered_search_tools):
         """Test that advanced_search is still registered when PubMed not available."""
-        from zotero_mcp.infrastructure.mcp.search_tools import register_search_tools
-
-        mock_mcp = MagicMock()
-        mock_client = MagicMock()
-
-        def tool_decorator():
-            def wrapper(func):
-                return func
-
-            return wrapper
-            return wrapper
-
-        mock_mcp.tool = MagicMock(side_effect=tool_decorator)
-
-        with patch("zotero_mcp.infrastructure.mcp.search_tools.pubmed_integration_available", return_value=False):
-            register_search_tools(mock_mcp, mock_client)
+        registered_tools = registered_search_tools(pubmed_available=False)
 
-        assert mock_mcp.tool.call_count == 2
+        assert len(registered_tools) == 2
+        assert "advanced_search" in registered_tools
 
-    def test_registers_check_articles_owned_when_pubmed_unavailable(self):
+    def test_registers_check_articles_owned_when_pubmed_unavailable(self, registered_search_tools):
         """Test that local PMID ownership checks remain available without PubMed bridge."""
-        from zotero_mcp.infrastructure.mcp.search_tools import register_search_tools
-
-        mock_mcp = MagicMock()
-        mock_client = MagicMock()
-        registered_tools = {}
-
-        def tool_decorator():
-            def wrapper(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
-
-        with patch("zotero_mcp.infrastructure.mcp.search_tools.pubmed_integration_available", return_value=False):
-            register_search_tools(mock_mcp, mock_client)
+        registered_tools = registered_search_tools(pubmed_available=False)
 
         assert "advanced_search" in registered_tools
         assert "check_articles_owned" in registered_tools
         assert "search_pubmed_exclude_owned" not in registered_tools
 
-    @patch("zotero_mcp.infrastructure.mcp.search_tools.pubmed_integration_available", return_value=True)
-    def test_registers_tools_when_available(self, _mock_available):
+    def test_registers_tools_when_available(self, registered_search_tools):
         """Test tool registration when PubMed available."""
-        from zotero_mcp.infrastructure.mcp.search_tools import register_search_tools
-
-        mock_mcp = MagicMock()
-        mock_client = MagicMock()
-
-        # Setup mock.tool() to return a decorator
-        def tool_decorator():
-            def wrapper(func):
-                return func
-
-            return wrapper
+        registered_tools = registered_search_tools(pubmed_available=True)
 
-        mock_mcp.tool = tool_decorator
-
-        register_search_tools(mock_mcp, mock_client)
-
-        # Function should complete without error
+        assert "advanced_search" in registered_tools
+        assert "check_articles_owned" in registered_tools
 
-    def test_registers_legacy_bridge_only_when_enabled(self):
+    def test_registers_legacy_bridge_only_when_enabled(self, registered_search_tools):
         """Test legacy PubMed search bridge is opt-in."""
-        from zotero_mcp.infrastructure.mcp.search_tools import register_search_tools
-
-        mock_mcp = MagicMock()
-        mock_client = MagicMock()
-        registered_tools = {}
-
-        def tool_decorator():
-            def wrapper(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return wrapper
-
-        mock_mcp.tool = tool_decorator
+        assert "search_pubmed_exclude_owned" not in registered_search_tools(pubmed_available=True)
 
-        with patch("zotero_mcp.infrastructure.mcp.search_tools.pubmed_integration_available", return_value=True):
-            register_search_tools(mock_mcp, mock_client, enable_pubmed_bridge_tools=True)
+        registered_tools = registered_search_tools(pubmed_available=True, enable_pubmed_bridge_tools=True)
 
         assert "search_pubmed_exclude_owned" in registered_tools
         assert "check_articles_owned" in registered_tools
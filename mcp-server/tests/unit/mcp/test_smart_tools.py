@@ -5,7 +5,6 @@ Tests the internal helper functions for duplicate detection and collection sugge
 """
 
 import pytest
-from unittest.mock import AsyncMock
 
 from zotero_mcp.infrastructure.mcp.smart_tools import (
     _normalize_title,
@@ -20,25 +19,19 @@ from zotero_mcp.infrastructure.mcp.smart_tools import (
 class TestNormalizeTitle:
     """Tests for _normalize_title function."""
 
-    def test_lowercase_conversion(self):
-        """Test conversion to lowercase."""
-        assert _normalize_title("HELLO WORLD") == "hello world"
-
-    def test_punctuation_removal(self):
-        """Test punctuation removal."""
-        assert _normalize_title("Hello, World! (2024)") == "hello world 2024"
-
-    def test_whitespace_normalization(self):
-        """Test whitespace normalization."""
-        assert _normalize_title("  Hello   World  ") == "hello world"
-
-    def test_empty_string(self):
-        """Test empty string handling."""
-        assert _normalize_title("") == ""
-
-    def test_none_handling(self):
-        """Test None handling returns empty string."""
-        assert _normalize_title(None) == ""
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            pytest.param("HELLO WORLD", "hello world", id="lowercase"),
+            pytest.param("Hello, World! (2024)", "hello world 2024", id="punctuation"),
+            pytest.param("  Hello   World  ", "hello world", id="whitespace"),
+            pytest.param("", "", id="empty"),
+            pytest.param(None, "", id="none"),
+        ],
+    )
+    def test_normalize_title(self, title, expected):
+        """Test lowercasing, punctuation removal and whitespace/empty handling."""
+        assert _normalize_title(title) == expected
 
     def test_special_chars(self):
         """Test special character handling."""
@@ -50,56 +43,30 @@ class TestNormalizeTitle:
 class TestExtractIdentifier:
     """Tests for _extract_identifier function."""
 
-    def test_extract_doi_from_field(self):
-        """Test DOI extraction from direct field."""
-        item = {"DOI": "10.1234/test"}
-        result = _extract_identifier(item, "DOI")
-        assert result == "10.1234/test"
-
-    def test_extract_pmid_from_extra(self):
-        """Test PMID extraction from extra field."""
-        item = {"extra": "PMID: 12345678"}
-        result = _extract_identifier(item, "PMID")
-        assert result == "12345678"
-
-    def test_extract_isbn_from_extra(self):
-        """Test ISBN extraction from extra field."""
-        item = {"extra": "ISBN: 978-0-123-45678-9"}
-        result = _extract_identifier(item, "ISBN")
-        assert result == "978-0-123-45678-9"
-
-    def test_case_insensitive_extra_search(self):
-        """Test case insensitive search in extra."""
-        item = {"extra": "pmid: 12345678"}
-        result = _extract_identifier(item, "PMID")
-        assert result == "12345678"
-
-    def test_missing_identifier(self):
-        """Test missing identifier returns None."""
-        item = {"title": "Test"}
-        result = _extract_identifier(item, "DOI")
-        assert result is None
-
-    def test_empty_extra_field(self):
-        """Test empty extra field."""
-        item = {"extra": ""}
-        result = _extract_identifier(item, "PMID")
-        assert result is None
-
-    def test_returns_lowercase(self):
-        """Test that identifiers are returned lowercase."""
-        item = {"DOI": "10.1234/TEST"}
-        result = _extract_identifier(item, "DOI")
-        assert result == "10.1234/test"
-
-
+    @pytest.mark.parametrize(
+        ("item", "field", "expected"),
+        [
+            pytest.param({"DOI": "10.1234/test"}, "DOI", "10.1234/test", id="doi_from_field"),
+            pytest.param({"extra": "PMID: 12345678"}, "PMID", "12345678", id="pmid_from_extra"),
+            pytest.param({"extra": "ISBN: 978-0-123-45678-9"}, "ISBN", "978-0-123-45678-9", id="isbn_from_extra"),
+            pytest.param({"extra": "pmid: 12345678"}, "PMID", "12345678", id="case_insensitive_extra"),
+            pytest.param({"title": "Test"}, "DOI", None, id="missing"),
+            pytest.param({"extra": ""}, "PMID", None, id="empty_extra"),
+            pytest.param({"DOI": "10.1234/TEST"}, "DOI", "10.1234/test", id="returns_lowercase"),
+        ],
+    )
+    def test_extract_identifier(self, item, field, expected):
+        """Test extraction from the field or extra, lowercased, or None when absent."""
+        assert _extract_identifier(item, field) == expected
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestSuggestCollections:
-    """Tests for _suggest_collections function."""
+    """Tests for _suggest_collections function (sharing one event loop)."""
 
-    @pytest.mark.asyncio
-    async def test_direct_title_match(self):
+    async def test_direct_title_match(self, async_stub):
         """Test suggestion when collection name in title."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_collections.return_value = [
             {"key": "ABC123", "data": {"name": "Machine Learning"}},
         ]
@@ -111,10 +78,9 @@ class TestSuggestCollections:
         assert suggestions[0]["key"] == "ABC123"
         assert suggestions[0]["score"] == 90
 
-    @pytest.mark.asyncio
-    async def test_tag_match(self):
+    async def test_tag_match(self, async_stub):
         """Test suggestion based on tag matching."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_collections.return_value = [
             {"key": "DEF456", "data": {"name": "Artificial Intelligence"}},
         ]
@@ -125,10 +91,9 @@ class TestSuggestCollections:
         assert len(suggestions) > 0
         assert any(s["key"] == "DEF456" for s in suggestions)
 
-    @pytest.mark.asyncio
-    async def test_no_suggestions_for_empty_item(self):
+    async def test_no_suggestions_for_empty_item(self, async_stub):
         """Test no suggestions for item with no text."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_collections.return_value = [
             {"key": "ABC123", "data": {"name": "Test"}},
         ]
@@ -138,10 +103,9 @@ class TestSuggestCollections:
 
         assert suggestions == []
 
-    @pytest.mark.asyncio
-    async def test_handles_empty_collections(self):
+    async def test_handles_empty_collections(self, async_stub):
         """Test handling when no collections exist."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_collections.return_value = []
 
         item = {"title": "Test Article"}
@@ -149,10 +113,9 @@ class TestSuggestCollections:
 
         assert suggestions == []
 
-    @pytest.mark.asyncio
-    async def test_handles_api_exception(self):
+    async def test_handles_api_exception(self, async_stub):
         """Test exception handling from API."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_collections.side_effect = Exception("API Error")
 
         item = {"title": "Test"}
@@ -160,10 +123,9 @@ class TestSuggestCollections:
 
         assert suggestions == []
 
-    @pytest.mark.asyncio
-    async def test_limits_suggestions(self):
+    async def test_limits_suggestions(self, async_stub):
         """Test that suggestions are limited to 5."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         # Create many matching collections
         collections = [{"key": f"KEY{i}", "data": {"name": f"Test{i}"}} for i in range(10)]
         mock_client.get_collections.return_value = collections
@@ -173,10 +135,9 @@ class TestSuggestCollections:
 
         assert len(suggestions) <= 5
 
-    @pytest.mark.asyncio
-    async def test_deduplicates_suggestions(self):
+    async def test_deduplicates_suggestions(self, async_stub):
         """Test that duplicate suggestions are removed."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.get_collections.return_value = [
             {"key": "ABC123", "data": {"name": "Machine Learning"}},
         ]
@@ -190,13 +151,13 @@ class TestSuggestCollections:
         assert keys.count("ABC123") == 1
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestFindDuplicates:
-    """Tests for _find_duplicates function."""
+    """Tests for _find_duplicates function (sharing one event loop)."""
 
-    @pytest.mark.asyncio
-    async def test_exact_doi_match(self):
+    async def test_exact_doi_match(self, async_stub):
         """Test exact DOI matching."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         # The search returns items that have the identifier in 'data' field
         mock_client.search_items.return_value = [
             {"key": "ABC123", "DOI": "10.1234/test", "data": {"title": "Existing", "DOI": "10.1234/test"}},
@@ -210,10 +171,9 @@ class TestFindDuplicates:
         # If no duplicates found, it falls through to fuzzy matching
         assert isinstance(duplicates, list)
 
-    @pytest.mark.asyncio
-    async def test_fuzzy_title_match(self):
+    async def test_fuzzy_title_match(self, async_stub):
         """Test fuzzy title matching."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.search_items.return_value = []
         mock_client.get_items.return_value = [
             {"key": "ABC123", "data": {"title": "A Study of Machine Learning"}},
@@ -225,20 +185,18 @@ class TestFindDuplicates:
         # Should find similar title
         assert len(duplicates) >= 0  # May or may not match depending on threshold
 
-    @pytest.mark.asyncio
-    async def test_no_duplicates_for_empty_title(self):
+    async def test_no_duplicates_for_empty_title(self, async_stub):
         """Test no duplicates for empty title."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
 
         item = {"title": ""}
         duplicates = await _find_duplicates(item, mock_client)
 
         assert duplicates == []
 
-    @pytest.mark.asyncio
-    async def test_pmid_match(self):
+    async def test_pmid_match(self, async_stub):
         """Test PMID matching from extra field."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.search_items.return_value = [
             {"key": "ABC123", "extra": "PMID: 12345678", "data": {"title": "Existing", "extra": "PMID: 12345678"}},
         ]
@@ -250,10 +208,9 @@ class TestFindDuplicates:
         # The function extracts identifier from extra field
         assert isinstance(duplicates, list)
 
-    @pytest.mark.asyncio
-    async def test_returns_exact_matches_first(self):
+    async def test_returns_exact_matches_first(self, async_stub):
         """Test that exact identifier matches are returned first."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.search_items.return_value = [
             {"key": "EXACT", "data": {"title": "DOI Match", "DOI": "10.1234/test"}},
         ]
@@ -268,17 +225,16 @@ class TestFindDuplicates:
         if len(duplicates) > 0 and duplicates[0]["key"] == "EXACT":
             assert duplicates[0]["score"] == 100
 
-    @pytest.mark.asyncio
-    async def test_respects_limit(self):
+    async def test_respects_limit(self, async_stub):
         """Test that limit is passed to get_items."""
-        mock_client = AsyncMock()
+        mock_client = async_stub
         mock_client.search_items.return_value = []
         mock_client.get_items.return_value = []
 
         item = {"title": "Test"}
         await _find_duplicates(item, mock_client, limit=50)
 
-        mock_client.get_items.assert_called_once_with(limit=50)
+        assert mock_client.get_items.calls == [((), {"limit": 50})]
 
 class TestConstants:
     """Tests for module constants."""
@@ -6,23 +6,36 @@ Ignores comments, documentation about pip (uv-enforcer, bylaws),
 and 'uv pip install' commands.
 """
 
+import mmap
 import re
 import subprocess
 import sys
 
 # Files that legitimately discuss pip (documentation, skills, etc.)
-EXCLUDED_PATTERNS = [
-    r"\.pre-commit-config\.yaml$",
-    r"node_modules",
-    r"\.git[/\\]",
-    r"CHANGELOG\.md$",
-    r"uv-enforcer[/\\]",  # uv-enforcer skill explains pip→uv
-    r"python-environment\.md$",  # bylaws explaining pip ban
-    r"REFERENCE_REPOSITORIES\.md$",  # third-party docs
-    r"\.ris$",  # bibliography files
-    r"check_no_pip\.py$",  # this script itself
-    r"precommit_.*\.txt$",  # pre-commit log files
-]
+# Plain suffix/substring checks; only the precommit log name needs a regex.
+EXCLUDED_SUFFIXES = (
+    ".pre-commit-config.yaml",
+    "CHANGELOG.md",
+    "python-environment.md",  # bylaws explaining pip ban
+    "REFERENCE_REPOSITORIES.md",  # third-party docs
+    ".ris",  # bibliography files
+    "check_no_pip.py",  # this script itself
+)
+EXCLUDED_SUBSTRINGS = (
+    "node_modules",
+    ".git/",
+    ".git\\",
+    "uv-enforcer/",  # uv-enforcer skill explains pip→uv
+    "uv-enforcer\\",
+)
+_EXCLUDED_RE = re.compile(r"precommit_.*\.txt$")  # pre-commit log files
+
+# Lines that are clearly uv pip (e.g., uvPath}" pip, uv pip, uv run pip)
+_UV_PIP_RE = re.compile(
+    r'uv["\'\'\s}\)]+pip\s+install|uv\s+pip\s+install|uv\s+pip\s+uninstall|uv\s+run\s+pip|uvPath[}"\'\'\s]+\s*pip\s+install|quoteArg\(uvPath\).*pip\s+install'
+)
+# Whole lines with a standalone pip install / python -m pip; [^\S\n] keeps a match on one line
+_PIP_LINE_RE = re.compile(r"(?m)^.*(?:\bpip[^\S\n]+install\b|python[^\S\n]+-m[^\S\n]+pip\b).*$")
 
 
 def main() -> int:
@@ -44,29 +57,40 @@ def main() -> int:
 
     for filepath in filepaths:
         # Skip excluded files
-        if any(re.search(pat, filepath) for pat in EXCLUDED_PATTERNS):
+        if (
+            filepath.endswith(EXCLUDED_SUFFIXES)
+            or any(sub in filepath for sub in EXCLUDED_SUBSTRINGS)
+            or _EXCLUDED_RE.search(filepath)
+        ):
             continue
 
         try:
-            with open(filepath, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+            with open(filepath, "rb") as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty file: nothing to map or scan
+                    continue
+                with mm:
+                    # Most files never mention pip; reject them from the mapping without reading them in
+                    if mm.find(b"pip") == -1:
+                        continue
+                    data = mm[:]
         except OSError:
             continue
+        content = data.decode("utf-8", errors="ignore")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-        for i, line in enumerate(content.splitlines()):
+        for m in _PIP_LINE_RE.finditer(content):
+            line = m.group()
             stripped = line.strip()
             # Skip comments
             if stripped.startswith("#") or stripped.startswith("//"):
                 continue
-            # Skip lines that are clearly uv pip (e.g., uvPath}" pip, uv pip, uv run pip)
-            if re.search(
-                r'uv["\'\'\s}\)]+pip\s+install|uv\s+pip\s+install|uv\s+pip\s+uninstall|uv\s+run\s+pip|uvPath[}"\'\'\s]+\s*pip\s+install|quoteArg\(uvPath\).*pip\s+install',
-                line,
-            ):
+            # Skip lines that are clearly uv pip
+            if _UV_PIP_RE.search(line):
                 continue
-            # Match standalone pip install / python -m pip
-            if re.search(r"\bpip\s+install\b|python\s+-m\s+pip\b", line):
-                matches.append((filepath, i + 1, stripped))
+            matches.append((filepath, content.count("\n", 0, m.start()) + 1, stripped))
 
     if matches:
         print("ERROR: pip usage detected (use uv instead):")
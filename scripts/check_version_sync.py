@@ -17,6 +17,9 @@ import re
 import sys
 from pathlib import Path
 
+_STATUS_BAR_VERSION_RE = re.compile(rb"private\s+version:\s*string\s*=\s*['\"]([^'\"]+)['\"]")
+_CHANGELOG_VERSION_RE = re.compile(rb"## \[(\d+\.\d+\.\d+)\]")
+
 
 def main() -> int:
     root = Path(__file__).resolve().parent.parent / "vscode-extension"
@@ -28,18 +31,16 @@ def main() -> int:
         print("SKIP: vscode-extension/package.json not found")
         return 0
 
-    with open(pkg_json, encoding="utf-8") as f:
-        pkg_version = json.load(f).get("version", "")
+    pkg_version = json.loads(pkg_json.read_bytes()).get("version", "")
     expected_ext_tag = f"v{pkg_version}-ext"
 
     # 2. statusBar.ts
     status_bar = root / "src" / "statusBar.ts"
     sb_version = ""
     if status_bar.exists():
-        content = status_bar.read_text(encoding="utf-8")
-        m = re.search(r"private\s+version:\s*string\s*=\s*['\"]([^'\"]+)['\"]", content)
+        m = _STATUS_BAR_VERSION_RE.search(status_bar.read_bytes())
         if m:
-            sb_version = m.group(1)
+            sb_version = m.group(1).decode("utf-8")
         else:
             errors.append("statusBar.ts: cannot find 'private version' field")
 
@@ -47,12 +48,15 @@ def main() -> int:
     changelog = root / "CHANGELOG.md"
     cl_version = ""
     if changelog.exists():
-        content = changelog.read_text(encoding="utf-8")
-        m = re.search(r"^## \[(\d+\.\d+\.\d+)\]", content, re.MULTILINE)
-        if m:
-            cl_version = m.group(1)
-        else:
-            errors.append("CHANGELOG.md: cannot find ## [X.Y.Z] entry")
+        # Only the newest entry matters; stop reading at the first heading
+        with open(changelog, "rb") as f:
+            for line in f:
+                m = _CHANGELOG_VERSION_RE.match(line)
+                if m:
+                    cl_version = m.group(1).decode("ascii")
+                    break
+            else:
+                errors.append("CHANGELOG.md: cannot find ## [X.Y.Z] entry")
 
     # Compare
     if pkg_version and sb_version and pkg_version != sb_version:
@@ -68,7 +72,7 @@ def main() -> int:
     # 4. package-lock.json
     package_lock = root / "package-lock.json"
     if package_lock.exists():
-        lock = json.loads(package_lock.read_text(encoding="utf-8"))
+        lock = json.loads(package_lock.read_bytes())
         lock_versions = [
             ("package-lock.json root", lock.get("version", "")),
             (
@@ -15,14 +15,31 @@ H. Version check accuracy
 
 Usage:
     python test_python_env_edge_cases.py
+
+    # Run scenarios in parallel (each has its own directory; logs interleave)
+    ZOTERO_KEEPER_TEST_JOBS=4 python test_python_env_edge_cases.py
+
+    # Slow runner: raise subprocess timeouts (seconds)
+    ZK_TEST_INSTALL_TIMEOUT=900 ZK_TEST_DEFAULT_TIMEOUT=300 python test_python_env_edge_cases.py
+
+    # Repeat runs: keep wheels in a persistent cache, then install from it only
+    UV_CACHE_DIR=~/.cache/zk-edge-uv python test_python_env_edge_cases.py
+    UV_CACHE_DIR=~/.cache/zk-edge-uv UV_OFFLINE=1 python test_python_env_edge_cases.py
 """
 
+import functools
+import json
 import os
+import platform
+import re
 import sys
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -59,15 +76,75 @@ def resolve_zotero_keeper_package() -> tuple[str, str]:
     )
 
 
+# Subprocess timeouts in seconds; raise them on slow CI runners via the environment
+INSTALL_TIMEOUT = int(os.environ.get("ZK_TEST_INSTALL_TIMEOUT", 300))  # uv venv / full installs
+DEFAULT_TIMEOUT = int(os.environ.get("ZK_TEST_DEFAULT_TIMEOUT", 120))  # single-package pip ops
+QUICK_TIMEOUT = int(os.environ.get("ZK_TEST_QUICK_TIMEOUT", 60))  # small installs, lookups
+VERSION_TIMEOUT = int(os.environ.get("ZK_TEST_VERSION_TIMEOUT", 30))  # version probes
+
 ZOTERO_KEEPER_PACKAGE, ZOTERO_KEEPER_PACKAGE_SOURCE = resolve_zotero_keeper_package()
 REQUIRED_PACKAGES = [
     ZOTERO_KEEPER_PACKAGE,
     PUBMED_SEARCH_PACKAGE,
 ]
 
-# Test directory - use temp
-TEST_BASE = Path(tempfile.mkdtemp(prefix="uvpy_test_"))
+# The extension's version check: NEED_PACKAGING, MISSING:<error> or OK (used by G1/G2)
+VERSION_CHECK_SCRIPT = """
+import sys
+try:
+    from packaging.version import Version
+except ImportError:
+    print("NEED_PACKAGING")
+    sys.exit(0)
+try:
+    import zotero_mcp
+    import pubmed_search
+except ImportError as e:
+    print(f"MISSING:{e}")
+    sys.exit(0)
+print("OK")
+"""
+
+# "Name: x" ... "Version: y" pair from each record of `uv pip show`
+_PIP_SHOW_RECORD_RE = re.compile(
+    r"^Name:[ \t]*(?P<name>\S+).*?^Version:[ \t]*(?P<version>\S+)", re.MULTILINE | re.DOTALL
+)
+
+# Interpreter location inside a venv, relative to the venv root
+_VENV_PYTHON_SUBPATH = ("Scripts", "python.exe") if sys.platform == "win32" else ("bin", "python")
+
 RESULTS: list[dict] = []
+RESULTS_PATH: Optional[Path] = None  # set by main(); record() appends one JSON line per result
+_TALLY = {"PASS": 0, "FAIL": 0}
+_RESULTS_LOCK = threading.Lock()  # record() runs on worker threads in parallel mode
+
+# Version probe (D3, H3): reads __version__, importlib.metadata and the packaging
+# check for every (pkg_name, import_name, min_ver) in argv[1] in one interpreter start
+_VERSION_PROBE_SCRIPT = """\
+import importlib, json, sys
+from importlib.metadata import version
+
+try:
+    from packaging.version import Version
+except ImportError:
+    Version = None
+
+out = {}
+for pkg_name, import_name, min_ver in json.loads(sys.argv[1]):
+    try:
+        attr_ver = getattr(importlib.import_module(import_name), "__version__", "NONE")
+    except Exception:
+        attr_ver = None
+    try:
+        meta_ver = version(pkg_name)
+    except Exception:
+        meta_ver = None
+    check = ""
+    if Version is not None and meta_ver is not None:
+        check = "OK" if Version(meta_ver) >= Version(min_ver) else f"OUTDATED:{meta_ver}"
+    out[pkg_name] = {"attr": attr_ver, "meta": meta_ver, "check": check}
+print(json.dumps(out))
+"""
 
 
 def _safe_print(msg: str):
@@ -78,20 +155,30 @@ def _safe_print(msg: str):
         print(msg.encode("ascii", errors="replace").decode("ascii"))
 
 
+_LOG_ICONS = {
+    "INFO": "[i]",
+    "OK": "[+]",
+    "FAIL": "[-]",
+    "WARN": "[!]",
+    "TEST": "[T]",
+}
+
+
 def log(msg: str, level: str = "INFO"):
-    icon = {
-        "INFO": "[i]",
-        "OK": "[+]",
-        "FAIL": "[-]",
-        "WARN": "[!]",
-        "TEST": "[T]",
-    }.get(level, "")
+    icon = _LOG_ICONS.get(level, "")
     _safe_print(f"  {icon} [{level}] {msg}")
 
 
 def record(test_name: str, passed: bool, detail: str = ""):
     status = "PASS" if passed else "FAIL"
-    RESULTS.append({"test": test_name, "status": status, "detail": detail})
+    result = {"test": test_name, "status": status, "detail": detail}
+    with _RESULTS_LOCK:
+        RESULTS.append(result)
+        _TALLY[status] += 1
+        # Written as it happens so a crashed or aborted run still leaves its results
+        if RESULTS_PATH is not None:
+            with open(RESULTS_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
     icon = "[PASS]" if passed else "[FAIL]"
     _safe_print(f"\n{icon} {test_name}")
     if detail:
@@ -101,36 +188,59 @@ def record(test_name: str, passed: bool, detail: str = ""):
 # ======================================================================
 # Helper: Find or get uv
 # ======================================================================
+@functools.lru_cache(maxsize=1)
 def get_uv_path() -> str:
-    """Find uv in PATH or download it."""
+    """Find uv in PATH (cached; the lookup cannot change during a run)."""
+    uv = shutil.which("uv")
+    if uv:
+        log(f"Found uv at: {uv}")
+        return uv
+
+    raise RuntimeError("uv not found. Please install uv first.")
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a file, falling back to a copy across filesystems."""
     try:
-        result = subprocess.run(
-            ["where", "uv"], capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
-            uv = result.stdout.strip().split("\n")[0].strip()
-            log(f"Found uv at: {uv}")
-            return uv
-    except Exception:
-        pass
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution name so ``zotero-keeper`` matches ``zotero_keeper``."""
+    return re.sub(r"[-_.]+", "_", name).lower()
+
 
-    # Try uv directly
+def _read_metadata_version(dist_info: Path) -> Optional[str]:
+    """Return the Version header from a dist-info METADATA file, if readable."""
     try:
-        result = subprocess.run(
-            ["uv", "--version"], capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
-            return "uv"
-    except Exception:
+        with open(dist_info / "METADATA", "rb") as f:
+            for line in f:
+                if line.startswith(b"Version:"):
+                    return line[8:].strip().decode("utf-8")
+                if not line.strip():
+                    break
+    except OSError:
         pass
-
-    raise RuntimeError("uv not found. Please install uv first.")
+    return None
 
 
 def run_cmd(
-    cmd: list[str], env: Optional[dict] = None, timeout: int = 120
+    cmd: list[str],
+    env: Optional[dict] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    text: bool = False,
+    capture: bool = True,
 ) -> subprocess.CompletedProcess:
-    """Run a command with timeout and return result."""
+    """Run a command with timeout and return result.
+
+    Output is captured as bytes unless ``text=True``; most callers only need
+    the return code, so installer progress output is never decoded. Pass
+    ``capture=False`` to send it to DEVNULL when even the bytes are unused;
+    on POSIX that also skips the fd sweep (fds are non-inheritable per PEP 446),
+    which lets CPython start the child with posix_spawn.
+    """
     merged_env = {
         **os.environ,
         "NO_COLOR": "1",
@@ -139,10 +249,14 @@ def run_cmd(
     }
     return subprocess.run(
         cmd,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE if capture else subprocess.DEVNULL,
+        close_fds=capture or sys.platform == "win32",
+        check=False,
+        text=text,
+        encoding="utf-8" if text else None,
+        errors="replace" if text else None,
         timeout=timeout,
         env=merged_env,
     )
@@ -156,23 +270,67 @@ def run_cmd(
 class TestPythonEnvEdgeCases:
     """Test all edge cases for UvPythonManager."""
 
-    def __init__(self):
+    def __init__(self, test_dir: Path):
         self.uv = get_uv_path()
-        self.test_dir = TEST_BASE
+        self.test_dir = test_dir
+        self.python_request = self._resolve_python()
+        self._template_lock = threading.Lock()
+        self._template_venv: Optional[Path] = None
+        self._cleanup_threads: list[threading.Thread] = []
+        self._version_check_path = test_dir / "_version_check.py"
+        self._version_check_path.write_text(VERSION_CHECK_SCRIPT, encoding="utf-8")
+
+    def _resolve_python(self) -> str:
+        """Install/locate uv's Python once so each venv skips interpreter discovery."""
+        run_cmd(
+            [self.uv, "python", "install", PYTHON_VERSION],
+            env={"UV_PYTHON_DOWNLOADS": "automatic"},
+            timeout=INSTALL_TIMEOUT,
+            capture=False,
+        )
+        result = run_cmd([self.uv, "python", "find", PYTHON_VERSION], timeout=QUICK_TIMEOUT, text=True)
+        found = result.stdout.strip()
+        if result.returncode == 0 and found:
+            log(f"Using Python {PYTHON_VERSION} at: {found}")
+            return found
+
+        log(f"Could not pre-resolve Python {PYTHON_VERSION}; uv will resolve it per venv", "WARN")
+        return PYTHON_VERSION
 
     def _make_scenario_dir(self, name: str) -> Path:
-        """Create a clean scenario directory."""
+        """Create a clean scenario directory.
+
+        A leftover directory is renamed aside and deleted in the background,
+        so the scenario does not wait on removing a whole site-packages tree.
+        """
         d = self.test_dir / name
         if d.exists():
-            shutil.rmtree(d, ignore_errors=True)
+            trash = d.with_name(f"{d.name}.trash.{uuid.uuid4().hex}")
+            try:
+                d.rename(trash)
+            except OSError:
+                # e.g. a file still open on Windows: fall back to deleting in place
+                shutil.rmtree(d, ignore_errors=True)
+            else:
+                cleaner = threading.Thread(
+                    target=shutil.rmtree,
+                    args=(trash,),
+                    kwargs={"ignore_errors": True},
+                    daemon=True,
+                )
+                cleaner.start()
+                self._cleanup_threads.append(cleaner)
         d.mkdir(parents=True, exist_ok=True)
         return d
 
+    def wait_for_cleanup(self) -> None:
+        """Wait for background deletions started by ``_make_scenario_dir``."""
+        for cleaner in self._cleanup_threads:
+            cleaner.join()
+
     def _get_python_in_venv(self, venv_dir: Path) -> Path:
         """Get Python binary path inside a venv."""
-        if sys.platform == "win32":
-            return venv_dir / "Scripts" / "python.exe"
-        return venv_dir / "bin" / "python"
+        return venv_dir.joinpath(*_VENV_PYTHON_SUBPATH)
 
     def _get_python_version_output(self, python_path: Path) -> Optional[str]:
         """Return Python version output if the interpreter is runnable."""
@@ -180,7 +338,7 @@ class TestPythonEnvEdgeCases:
             return None
 
         try:
-            result = run_cmd([str(python_path), "--version"], timeout=30)
+            result = run_cmd([str(python_path), "--version"], timeout=VERSION_TIMEOUT, text=True)
         except (OSError, subprocess.SubprocessError):
             return None
 
@@ -226,22 +384,75 @@ class TestPythonEnvEdgeCases:
             shutil.rmtree(venv_dir, ignore_errors=True)
 
         result = run_cmd(
-            [self.uv, "venv", str(venv_dir), "--python", PYTHON_VERSION],
+            [self.uv, "venv", str(venv_dir), "--python", self.python_request],
             env={"UV_PYTHON_DOWNLOADS": "automatic"},
-            timeout=300,
+            timeout=INSTALL_TIMEOUT,
+            capture=False,
         )
         return result.returncode == 0
 
+    def _get_template_venv(self) -> Optional[Path]:
+        """Build a relocatable venv with REQUIRED_PACKAGES + packaging once; later calls reuse it."""
+        with self._template_lock:
+            if self._template_venv is None:
+                template = self.test_dir / "_template_venv"
+                result = run_cmd(
+                    [
+                        self.uv,
+                        "venv",
+                        str(template),
+                        "--relocatable",
+                        "--python",
+                        self.python_request,
+                    ],
+                    env={"UV_PYTHON_DOWNLOADS": "automatic"},
+                    timeout=INSTALL_TIMEOUT,
+                    capture=False,
+                )
+                if result.returncode != 0:
+                    return None
+                # packaging rides along so D3's version check needs no extra install
+                ok, _ = self._install_packages(template, [*REQUIRED_PACKAGES, "packaging"])
+                if not ok:
+                    shutil.rmtree(template, ignore_errors=True)
+                    return None
+                self._template_venv = template
+            return self._template_venv
+
+    def _clone_template_venv(self, venv_dir: Path) -> tuple[bool, str]:
+        """Hardlink-copy the template venv for scenarios that only need a ready venv.
+
+        Files are shared with the template, so callers may add or remove
+        packages but must not edit existing files in place.
+        """
+        template = self._get_template_venv()
+        if template is None:
+            return False, "Cannot build template venv"
+        shutil.copytree(template, venv_dir, symlinks=True, copy_function=_link_or_copy)
+        return True, ""
+
     def _install_packages(
         self, venv_dir: Path, packages: list[str]
     ) -> tuple[bool, str]:
-        """Install packages into venv using uv."""
+        """Install packages into venv using uv in a single resolve."""
         python = str(self._get_python_in_venv(venv_dir))
+        env = {"VIRTUAL_ENV": str(venv_dir)}
+        result = run_cmd(
+            [self.uv, "pip", "install", "--upgrade", "--python", python, *packages],
+            env=env,
+            timeout=2 * INSTALL_TIMEOUT,
+            text=True,
+        )
+        if result.returncode == 0:
+            return True, ""
+
+        # Retry one at a time so the error names the package that broke
         for pkg in packages:
             result = run_cmd(
                 [self.uv, "pip", "install", "--upgrade", "--python", python, pkg],
-                env={"VIRTUAL_ENV": str(venv_dir)},
-                timeout=300,
+                env=env,
+                timeout=INSTALL_TIMEOUT,
+                text=True,
             )
             if result.returncode != 0:
                 return False, f"Failed to install {pkg}: {result.stderr}"
@@ -256,27 +467,71 @@ class TestPythonEnvEdgeCases:
                 "-c",
                 f'import {import_name}; print(getattr({import_name}, "__version__", "NONE"))',
             ],
-            timeout=30,
+            timeout=VERSION_TIMEOUT,
+            text=True,
         )
         if result.returncode == 0:
             return result.stdout.strip()
         return None
 
-    def _check_installed_version_via_pip(
-        self, venv_dir: Path, pkg_name: str
-    ) -> Optional[str]:
-        """Check installed version using uv pip show."""
+    def _check_package_versions(
+        self, venv_dir: Path, import_names: list[str]
+    ) -> dict[str, Optional[str]]:
+        """Check several modules' __version__ with the interpreter starts overlapped."""
+        with ThreadPoolExecutor(max_workers=len(import_names)) as pool:
+            versions = pool.map(
+                functools.partial(self._check_package_version, venv_dir), import_names
+            )
+            return dict(zip(import_names, versions))
+
+    def _metadata_version(self, venv_dir: Path, pkg_name: str) -> Optional[str]:
+        """Read an installed package's version from its dist-info, no subprocess.
+
+        Wheel installs name the folder ``<name>-<version>.dist-info``, so the
+        version normally comes from the name alone; METADATA is only opened
+        when the folder name carries no version.
+        """
+        if sys.platform == "win32":
+            site_dirs = [venv_dir / "Lib" / "site-packages"]
+        else:
+            site_dirs = list(venv_dir.glob("lib/python3*/site-packages"))
+        wanted = _normalize_dist_name(pkg_name)
+        for site_dir in site_dirs:
+            try:
+                entries = os.scandir(site_dir)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith(".dist-info"):
+                        continue
+                    name, _, version = entry.name[: -len(".dist-info")].partition("-")
+                    if _normalize_dist_name(name) != wanted:
+                        continue
+                    if version:
+                        return version
+                    version = _read_metadata_version(Path(entry.path))
+                    if version:
+                        return version
+        return None
+
+    def _pip_show_versions(
+        self, venv_dir: Path, pkg_names: list[str]
+    ) -> dict[str, Optional[str]]:
+        """Check installed versions of several packages with one uv pip show."""
         python = str(self._get_python_in_venv(venv_dir))
         result = run_cmd(
-            [self.uv, "pip", "show", "--python", python, pkg_name],
+            [self.uv, "pip", "show", "--python", python, *pkg_names],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=30,
+            timeout=VERSION_TIMEOUT,
+            text=True,
         )
-        if result.returncode == 0:
-            for line in result.stdout.split("\n"):
-                if line.startswith("Version:"):
-                    return line.split(":", 1)[1].strip()
-        return None
+        # One Name/Version record per found package; missing ones are simply absent
+        found = {
+            _normalize_dist_name(m["name"]): m["version"]
+            for m in _PIP_SHOW_RECORD_RE.finditer(result.stdout)
+        }
+        return {pkg: found.get(_normalize_dist_name(pkg)) for pkg in pkg_names}
 
     # ------------------------------------------------------------------
     # A. Fresh Install
@@ -313,8 +568,8 @@ class TestPythonEnvEdgeCases:
 
         # Step 3: Verify imports work
         log("Verifying imports...")
-        for mod in ["zotero_mcp", "pubmed_search"]:
-            ver = self._check_package_version(venv_dir, mod)
+        versions = self._check_package_versions(venv_dir, ["zotero_mcp", "pubmed_search"])
+        for mod, ver in versions.items():
             if ver is None:
                 record("A1_fresh_install", False, f"Cannot import {mod}")
                 return
@@ -333,7 +588,7 @@ class TestPythonEnvEdgeCases:
 
         # Check system Python
         try:
-            result = run_cmd([sys.executable, "--version"])
+            result = run_cmd([sys.executable, "--version"], text=True)
             sys_ver = result.stdout.strip()
             log(f"System Python: {sys_ver} at {sys.executable}")
         except Exception:
@@ -353,7 +608,7 @@ class TestPythonEnvEdgeCases:
         uv_python = self._get_python_in_venv(venv_dir)
 
         # Verify uv-managed Python is different from system Python
-        result = run_cmd([str(uv_python), "-c", "import sys; print(sys.executable)"])
+        result = run_cmd([str(uv_python), "-c", "import sys; print(sys.executable)"], text=True)
         uv_executable = result.stdout.strip()
 
         log(f"System Python: {sys.executable}")
@@ -384,7 +639,7 @@ class TestPythonEnvEdgeCases:
             return
 
         uv_python = self._get_python_in_venv(venv_dir)
-        result = run_cmd([str(uv_python), "--version"])
+        result = run_cmd([str(uv_python), "--version"], text=True)
         version = result.stdout.strip()
         log(f"Python version in venv: {version}")
 
@@ -434,7 +689,8 @@ class TestPythonEnvEdgeCases:
         result = run_cmd(
             [self.uv, "venv", str(venv_dir), "--python", "3.11"],
             env={"UV_PYTHON_DOWNLOADS": "automatic"},
-            timeout=300,
+            timeout=INSTALL_TIMEOUT,
+            text=True,
         )
         if result.returncode != 0:
             log(f"Could not create 3.11 venv: {result.stderr}", "WARN")
@@ -442,14 +698,14 @@ class TestPythonEnvEdgeCases:
             return
 
         python = self._get_python_in_venv(venv_dir)
-        r1 = run_cmd([str(python), "--version"])
+        r1 = run_cmd([str(python), "--version"], text=True)
         log(f"Before: {r1.stdout.strip()}")
 
         # Now overwrite with 3.12
         log("Overwriting with Python 3.12...")
         ok = self._create_venv(venv_dir)
 
-        r2 = run_cmd([str(python), "--version"])
+        r2 = run_cmd([str(python), "--version"], text=True)
         log(f"After:  {r2.stdout.strip()}")
 
         is_312 = "Python 3.12" in r2.stdout
@@ -482,27 +738,18 @@ class TestPythonEnvEdgeCases:
         python.write_bytes(b"\x00\x00\x00CORRUPTED")
         python.chmod(0o755)
 
-        # Verify it's broken (on Windows, running corrupted exe gives WinError 216)
-        try:
-            result = run_cmd([str(python), "--version"])
-            is_broken = result.returncode != 0
-        except (OSError, subprocess.SubprocessError):
-            is_broken = True
+        # One probe serves both checks: the binary is broken, and the fixed
+        # checkReadySync (which runs python --version instead of only checking
+        # the file exists) refuses it. On Windows the corrupted exe raises
+        # WinError 216, which the probe reports as None.
+        version_output = self._get_python_version_output(python)
+        is_broken = version_output is None
         log(f"Corrupted binary is broken: {is_broken} (should be True)")
 
-        # Extension's checkReadySync AFTER FIX: should detect corruption
-        # (now tries to run python --version, not just check file existence)
         exists = python.exists()
         log(f"File exists: {exists} (binary is there but broken)")
 
-        # Simulate fixed checkReadySync: try to run it
-        try:
-            result = run_cmd([str(python), "--version"])
-            reports_python = (
-                result.returncode == 0 and result.stdout.strip().startswith("Python")
-            )
-        except (OSError, subprocess.SubprocessError):
-            reports_python = False
+        reports_python = version_output is not None and version_output.startswith("Python")
         log(
             f"Fixed checkReadySync would report ready: {reports_python} (should be False)"
         )
@@ -511,11 +758,8 @@ class TestPythonEnvEdgeCases:
         log("Re-creating venv over corrupted one...")
         ok = self._create_venv(venv_dir)
 
-        try:
-            result = run_cmd([str(python), "--version"])
-            fixed = result.returncode == 0 and "Python 3.12" in result.stdout
-        except (OSError, subprocess.SubprocessError):
-            fixed = False
+        fixed_output = self._get_python_version_output(python)
+        fixed = fixed_output is not None and "Python 3.12" in fixed_output
 
         record(
             "C3_corrupted_python",
@@ -542,7 +786,7 @@ class TestPythonEnvEdgeCases:
         python = self._get_python_in_venv(venv_dir)
 
         # Try importing without packages installed
-        result = run_cmd([str(python), "-c", "import zotero_mcp"])
+        result = run_cmd([str(python), "-c", "import zotero_mcp"], capture=False)
         can_import = result.returncode == 0
         log(f"Import zotero_mcp without install: {can_import} (should be False)")
 
@@ -553,7 +797,7 @@ class TestPythonEnvEdgeCases:
             record("C4_missing_packages_detect", False, err)
             return
 
-        result = run_cmd([str(python), "-c", "import zotero_mcp"])
+        result = run_cmd([str(python), "-c", "import zotero_mcp"], capture=False)
         can_import_after = result.returncode == 0
 
         record(
@@ -624,7 +868,8 @@ class TestPythonEnvEdgeCases:
                 "zotero-keeper==1.10.0",
             ],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=120,
+            timeout=DEFAULT_TIMEOUT,
+            text=True,
         )
 
         if result.returncode != 0:
@@ -633,10 +878,11 @@ class TestPythonEnvEdgeCases:
             result = run_cmd(
                 [self.uv, "pip", "install", "--python", str(python), "zotero-keeper"],
                 env={"VIRTUAL_ENV": str(venv_dir)},
-                timeout=120,
+                timeout=DEFAULT_TIMEOUT,
+                capture=False,
             )
 
-        ver_before = self._check_installed_version_via_pip(venv_dir, "zotero-keeper")
+        ver_before = self._metadata_version(venv_dir, "zotero-keeper")
         log(f"Version before upgrade: {ver_before}")
 
         # Upgrade with version constraint
@@ -652,10 +898,11 @@ class TestPythonEnvEdgeCases:
                 "zotero-keeper>=1.11.0",
             ],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=120,
+            timeout=DEFAULT_TIMEOUT,
+            capture=False,
         )
 
-        ver_after = self._check_installed_version_via_pip(venv_dir, "zotero-keeper")
+        ver_after = self._metadata_version(venv_dir, "zotero-keeper")
         log(f"Version after upgrade: {ver_after}")
 
         record(
@@ -685,10 +932,11 @@ class TestPythonEnvEdgeCases:
         run_cmd(
             [self.uv, "pip", "install", "--python", python, "zotero-keeper>=1.11.0"],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=120,
+            timeout=DEFAULT_TIMEOUT,
+            capture=False,
         )
 
-        ver1 = self._check_installed_version_via_pip(venv_dir, "zotero-keeper")
+        ver1 = self._metadata_version(venv_dir, "zotero-keeper")
         log(f"Installed version: {ver1}")
 
         # Uninstall
@@ -696,10 +944,11 @@ class TestPythonEnvEdgeCases:
         _result = run_cmd(
             [self.uv, "pip", "uninstall", "--python", python, "zotero-keeper"],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=30,
+            timeout=VERSION_TIMEOUT,
+            capture=False,
         )
 
-        ver2 = self._check_installed_version_via_pip(venv_dir, "zotero-keeper")
+        ver2 = self._metadata_version(venv_dir, "zotero-keeper")
         log(f"After uninstall: {ver2}")
 
         # Reinstall (what upgradePackages does)
@@ -715,10 +964,11 @@ class TestPythonEnvEdgeCases:
                 "zotero-keeper>=1.11.0",
             ],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=120,
+            timeout=DEFAULT_TIMEOUT,
+            capture=False,
         )
 
-        ver3 = self._check_installed_version_via_pip(venv_dir, "zotero-keeper")
+        ver3 = self._metadata_version(venv_dir, "zotero-keeper")
         log(f"After reinstall: {ver3}")
 
         record(
@@ -739,47 +989,34 @@ class TestPythonEnvEdgeCases:
         d = self._make_scenario_dir("D3_version_mismatch")
         venv_dir = d / "venv"
 
-        ok = self._create_venv(venv_dir)
+        # Packages installed from the shared template; A1 covers the install path itself
+        ok, err = self._clone_template_venv(venv_dir)
         if not ok:
-            record("D3_version_check_accuracy", False, "Cannot create venv")
+            record("D3_version_check_accuracy", False, err)
             return
 
         python = str(self._get_python_in_venv(venv_dir))
 
-        # Install packages
-        ok, err = self._install_packages(venv_dir, REQUIRED_PACKAGES)
-        if not ok:
-            record("D3_version_check_accuracy", False, err)
+        # Check __version__ vs importlib.metadata.version vs pip show
+        checks = [
+            ("zotero-keeper", "zotero_mcp", "1.12.0"),
+            ("pubmed-search-mcp", "pubmed_search", "0.5.17"),
+        ]
+        probe = run_cmd([python, "-I", "-c", _VERSION_PROBE_SCRIPT, json.dumps(checks)], text=True)
+        try:
+            probed = json.loads(probe.stdout)
+        except ValueError:
+            record("D3_version_check_accuracy", False, f"Version probe failed: {probe.stderr}")
             return
 
-        # Also install packaging
-        run_cmd(
-            [self.uv, "pip", "install", "--python", python, "packaging"],
-            env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=60,
-        )
+        pip_versions = self._pip_show_versions(venv_dir, [pkg for pkg, _, _ in checks])
 
-        # Check __version__ vs importlib.metadata.version vs pip show
         issues = []
         _all_ok = True
-        for pkg_name, import_name, min_ver in [
-            ("zotero-keeper", "zotero_mcp", "1.12.0"),
-            ("pubmed-search-mcp", "pubmed_search", "0.5.17"),
-        ]:
-            attr_ver = self._check_package_version(venv_dir, import_name)
-            pip_ver = self._check_installed_version_via_pip(venv_dir, pkg_name)
-
-            # Check importlib.metadata version (the FIXED approach)
-            meta_result = run_cmd(
-                [
-                    python,
-                    "-c",
-                    f'from importlib.metadata import version; print(version("{pkg_name}"))',
-                ]
-            )
-            meta_ver = (
-                meta_result.stdout.strip() if meta_result.returncode == 0 else None
-            )
+        for pkg_name, _import_name, min_ver in checks:
+            attr_ver = probed[pkg_name]["attr"]
+            meta_ver = probed[pkg_name]["meta"]
+            pip_ver = pip_versions.get(pkg_name)
 
             log(f"{pkg_name}:")
             log(f"  __version__ attr:     {attr_ver}")
@@ -800,17 +1037,7 @@ class TestPythonEnvEdgeCases:
                 _all_ok = False  # noqa: F841
 
             # Simulate the FIXED extension version check
-            result = run_cmd(
-                [
-                    python,
-                    "-c",
-                    f"from packaging.version import Version; "
-                    f"from importlib.metadata import version as get_version; "
-                    f'v = get_version("{pkg_name}"); '
-                    f'print("OK" if Version(v) >= Version("{min_ver}") else f"OUTDATED:{{v}}")',
-                ]
-            )
-            ver_check_result = result.stdout.strip()
+            ver_check_result = probed[pkg_name]["check"]
             log(f"  Fixed version check:  {ver_check_result}")
 
             if "OUTDATED" in ver_check_result:
@@ -856,9 +1083,10 @@ class TestPythonEnvEdgeCases:
                 "zotero-keeper>=1.11.0",
             ],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=120,
+            timeout=DEFAULT_TIMEOUT,
+            capture=False,
         )
-        ver1 = self._check_installed_version_via_pip(venv_dir, "zotero-keeper")
+        ver1 = self._metadata_version(venv_dir, "zotero-keeper")
 
         # Upgrade again (should be quick no-op)
         start = time.time()
@@ -873,10 +1101,11 @@ class TestPythonEnvEdgeCases:
                 "zotero-keeper>=1.11.0",
             ],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=120,
+            timeout=DEFAULT_TIMEOUT,
+            capture=False,
         )
         elapsed = time.time() - start
-        ver2 = self._check_installed_version_via_pip(venv_dir, "zotero-keeper")
+        ver2 = self._metadata_version(venv_dir, "zotero-keeper")
 
         log(f"Version before: {ver1}, after: {ver2}")
         log(f"Upgrade elapsed: {elapsed:.1f}s (should be fast)")
@@ -899,15 +1128,15 @@ class TestPythonEnvEdgeCases:
         d = self._make_scenario_dir("E1_reinstall")
         venv_dir = d / "venv"
 
-        # First install
+        # First install: only the starting state, so take it from the template;
+        # the reinstall below is the part under test and still goes through uv
         log("Initial install...")
-        ok = self._create_venv(venv_dir)
+        ok, _ = self._clone_template_venv(venv_dir)
         if not ok:
             record("E1_cleanup_reinstall", False, "Cannot create initial venv")
             return
 
         python = str(self._get_python_in_venv(venv_dir))
-        ok, _ = self._install_packages(venv_dir, REQUIRED_PACKAGES)
 
         # Cleanup (simulating uvPython.cleanup())
         log("Cleaning up (removing venv dir)...")
@@ -977,19 +1206,19 @@ class TestPythonEnvEdgeCases:
         run_cmd(
             [self.uv, "pip", "install", "--python", python, "packaging"],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=60,
+            timeout=QUICK_TIMEOUT,
+            capture=False,
         )
 
-        has_pkg_before = run_cmd([python, "-c", "import packaging"]).returncode == 0
+        has_pkg_before = run_cmd([python, "-c", "import packaging"], capture=False).returncode == 0
         log(f"packaging installed before overwrite: {has_pkg_before}")
 
         # Overwrite
         log("Overwriting venv...")
         ok = self._create_venv(venv_dir)
-        python = str(self._get_python_in_venv(venv_dir))
 
         # After overwrite, the venv should be fresh (no packages)
-        has_pkg_after = run_cmd([python, "-c", "import packaging"]).returncode == 0
+        has_pkg_after = run_cmd([python, "-c", "import packaging"], capture=False).returncode == 0
         log(f"packaging installed after overwrite: {has_pkg_after}")
 
         # uv venv may or may not clear packages. Document behavior.
@@ -1019,21 +1248,8 @@ class TestPythonEnvEdgeCases:
 
         python = str(self._get_python_in_venv(venv_dir))
 
-        # The extension's version check script
-        version_check_script = """
-import sys
-try:
-    from packaging.version import Version
-except ImportError:
-    print("NEED_PACKAGING")
-    sys.exit(0)
-print("HAS_PACKAGING")
-"""
-        script_path = str(d / "check.py")
-        with open(script_path, "w") as f:
-            f.write(version_check_script)
-
-        result = run_cmd([python, script_path])
+        # The extension's version check script (-I: no user site or PYTHON* env lookups)
+        result = run_cmd([python, "-I", str(self._version_check_path)], text=True)
         output = result.stdout.strip()
         log(f"Result without packaging: {output}")
 
@@ -1064,29 +1280,11 @@ print("HAS_PACKAGING")
         run_cmd(
             [self.uv, "pip", "install", "--python", python, "packaging"],
             env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=60,
+            timeout=QUICK_TIMEOUT,
+            capture=False,
         )
 
-        version_check_script = """
-import sys
-try:
-    from packaging.version import Version
-except ImportError:
-    print("NEED_PACKAGING")
-    sys.exit(0)
-try:
-    import zotero_mcp
-    import pubmed_search
-except ImportError as e:
-    print(f"MISSING:{e}")
-    sys.exit(0)
-print("OK")
-"""
-        script_path = str(d / "check.py")
-        with open(script_path, "w") as f:
-            f.write(version_check_script)
-
-        result = run_cmd([python, script_path])
+        result = run_cmd([python, "-I", str(self._version_check_path)], text=True)
         output = result.stdout.strip()
         log(f"Result with missing modules: {output}")
 
@@ -1132,25 +1330,40 @@ print("OK")
     def test_H2_concurrent_venv_creation(self):
         """H2: Check that concurrent venv creation is handled."""
         print("\n" + "=" * 60)
-        print("H2: Rapid consecutive venv creation")
+        print("H2: Concurrent venv creation")
         print("=" * 60)
 
         d = self._make_scenario_dir("H2_concurrent")
         venv_dir = d / "venv"
 
-        # Create twice rapidly
-        log("First creation...")
-        ok1 = self._create_venv(venv_dir)
-        log("Second creation (immediate)...")
-        ok2 = self._create_venv(venv_dir)
+        # Two activations racing on the same target (e.g. two VS Code windows):
+        # both see no venv and run uv venv at the same time
+        log("Creating the same venv from two threads at once...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ok1, ok2 = pool.map(self._create_venv, [venv_dir, venv_dir])
 
+        # One creation may lose the race, but the survivor must be complete
         python = self._get_python_in_venv(venv_dir)
-        result = run_cmd([str(python), "--version"])
+        has_cfg = (venv_dir / "pyvenv.cfg").exists()
+
+        # A torn creation can leave lib/ without site-packages, or one per
+        # Python version; exactly one must exist and be the interpreter's own
+        if sys.platform == "win32":
+            site_dirs = [p for p in [venv_dir / "Lib" / "site-packages"] if p.is_dir()]
+        else:
+            site_dirs = [p for p in venv_dir.glob("lib/python3*/site-packages") if p.is_dir()]
+        result = run_cmd(
+            [str(python), "-I", "-c", "import sysconfig; print(sysconfig.get_path('purelib'))"],
+            text=True,
+        )
+        purelib = result.stdout.strip() if result.returncode == 0 else ""
+        lib_ok = len(site_dirs) == 1 and bool(purelib) and Path(purelib).resolve() == site_dirs[0].resolve()
 
         record(
             "H2_rapid_venv_creation",
-            ok1 and ok2 and result.returncode == 0,
-            f"Create1: {ok1}, Create2: {ok2}, Python works: {result.returncode == 0}",
+            (ok1 or ok2) and result.returncode == 0 and has_cfg and lib_ok,
+            f"Create1: {ok1}, Create2: {ok2}, Python works: {result.returncode == 0}, "
+            f"pyvenv.cfg present: {has_cfg}, site-packages complete: {lib_ok}",
         )
 
     def test_H3_install_with_network_package(self):
@@ -1169,43 +1382,57 @@ print("OK")
 
         python = str(self._get_python_in_venv(venv_dir))
 
-        # Install pubmed-search-mcp with --upgrade (what the extension does)
+        # Install pubmed-search-mcp with --upgrade (what the extension does).
+        # A1 usually leaves it in the uv cache, so try that before the network.
         log("Installing pubmed-search-mcp with --upgrade...")
-        _result = run_cmd(
-            [
-                self.uv,
-                "pip",
-                "install",
-                "--upgrade",
-                "--python",
-                python,
-                PUBMED_SEARCH_PACKAGE,
-            ],
-            env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=120,
-        )
-
-        # Install packaging for version check
-        run_cmd(
-            [self.uv, "pip", "install", "--python", python, "packaging"],
-            env={"VIRTUAL_ENV": str(venv_dir)},
-            timeout=60,
-        )
+        for network_flags in (["--offline"], []):
+            result = run_cmd(
+                [
+                    self.uv,
+                    "pip",
+                    "install",
+                    "--upgrade",
+                    *network_flags,
+                    "--python",
+                    python,
+                    PUBMED_SEARCH_PACKAGE,
+                ],
+                env={"VIRTUAL_ENV": str(venv_dir)},
+                timeout=DEFAULT_TIMEOUT,
+                # Only a failed network install's error is reported
+                capture=not network_flags,
+                text=not network_flags,
+            )
+            if result.returncode == 0:
+                break
+            if network_flags:
+                log("Not available offline from the uv cache; installing from the network...")
+        else:
+            record("H3_pypi_upgrade", False, f"Install failed: {result.stderr}")
+            return
 
-        pip_ver = self._check_installed_version_via_pip(venv_dir, "pubmed-search-mcp")
-        attr_ver = self._check_package_version(venv_dir, "pubmed_search")
+        # Installed version straight from the dist-info; D3 covers uv pip show
+        pip_ver = self._metadata_version(venv_dir, "pubmed-search-mcp")
 
-        # Check importlib.metadata version (our fix)
-        meta_result = run_cmd(
+        # __version__ and importlib.metadata (our fix) from the venv's Python in one start
+        probe = run_cmd(
             [
                 python,
+                "-I",
                 "-c",
-                'from importlib.metadata import version; print(version("pubmed-search-mcp"))',
-            ]
+                _VERSION_PROBE_SCRIPT,
+                json.dumps([("pubmed-search-mcp", "pubmed_search", "0")]),
+            ],
+            text=True,
         )
-        meta_ver = meta_result.stdout.strip() if meta_result.returncode == 0 else None
+        try:
+            probed = json.loads(probe.stdout)["pubmed-search-mcp"]
+        except (ValueError, KeyError):
+            probed = {}
+        attr_ver = probed.get("attr")
+        meta_ver = probed.get("meta")
 
-        log(f"pip show version:        {pip_ver}")
+        log(f"dist-info version:       {pip_ver}")
         log(f"__version__ attr:        {attr_ver}")
         log(f"importlib.metadata:      {meta_ver}")
 
@@ -1223,75 +1450,99 @@ print("OK")
 # ======================================================================
 # Main
 # ======================================================================
+def _run_scenario(test_fn) -> None:
+    """Run one scenario, recording an unexpected exception as a failure."""
+    try:
+        test_fn()
+    except Exception as e:
+        record(test_fn.__name__, False, f"EXCEPTION: {e}")
+
+
 def main():
+    global RESULTS_PATH
     print("=" * 70)
     print("  UvPythonManager Edge Case Test Suite")
     print("  Testing Python env installation robustness")
     print("=" * 70)
-    print(f"\nTest directory: {TEST_BASE}")
-    print(
-        f"Platform: {sys.platform}-{os.uname().machine if hasattr(os, 'uname') else 'x64'}"
-    )
+    jobs_setting = os.environ.get("ZOTERO_KEEPER_TEST_JOBS") or "1"
+    try:
+        jobs = max(1, int(jobs_setting))
+    except ValueError:
+        _safe_print(f"\nZOTERO_KEEPER_TEST_JOBS must be a whole number, got {jobs_setting!r}")
+        return 2
+    # Created here rather than at import so importing the module has no side effects
+    test_base = Path(tempfile.mkdtemp(prefix="uvpy_test_"))
+    # Beside test_base, not inside it, so the log outlives the cleanup below
+    RESULTS_PATH = test_base.with_name(f"{test_base.name}_results.ndjson")
+    print(f"\nTest directory: {test_base}")
+    print(f"Results log: {RESULTS_PATH}")
+    print(f"Platform: {sys.platform}-{platform.machine() or 'x64'}")
     print(f"System Python: {sys.version}")
     print(f"Zotero Keeper source: {ZOTERO_KEEPER_PACKAGE_SOURCE}")
+    print(f"Parallel jobs: {jobs}")
+    # One cache on the venvs' filesystem lets uv hardlink wheels into every scenario
+    os.environ.setdefault("UV_CACHE_DIR", str(test_base / ".uv-cache"))
+    print(f"uv cache: {os.environ['UV_CACHE_DIR']}")
 
-    tester = TestPythonEnvEdgeCases()
-
-    # Run all tests
-    tests = [
-        tester.test_A1_fresh_install,
-        tester.test_B1_system_python_exists,
-        tester.test_B2_old_system_python,
-        tester.test_C1_venv_dir_exists_empty,
-        tester.test_C2_venv_exists_with_different_python,
-        tester.test_C3_corrupted_python_binary,
-        tester.test_C4_venv_exists_packages_missing,
-        tester.test_C5_partial_venv_structure,
-        tester.test_D1_packages_outdated,
-        tester.test_D2_package_uninstall_reinstall,
-        tester.test_D3_version_check_accuracy,
-        tester.test_D4_already_latest_upgrade,
-        tester.test_E1_cleanup_and_reinstall,
-        tester.test_E2_cleanup_nonexistent,
-        tester.test_F1_uv_overwrite_existing_venv,
-        tester.test_G1_version_check_no_packaging,
-        tester.test_G2_version_check_missing_module,
-        tester.test_H1_double_install_packages,
-        tester.test_H2_concurrent_venv_creation,
-        tester.test_H3_install_with_network_package,
-    ]
-
-    for test_fn in tests:
-        try:
-            test_fn()
-        except Exception as e:
-            record(test_fn.__name__, False, f"EXCEPTION: {e}")
+    tester = TestPythonEnvEdgeCases(test_base)
 
-    # Summary
-    print("\n" + "=" * 70)
-    print("  TEST SUMMARY")
-    print("=" * 70)
-
-    passed = sum(1 for r in RESULTS if r["status"] == "PASS")
-    failed = sum(1 for r in RESULTS if r["status"] == "FAIL")
-    total = len(RESULTS)
+    # Run all tests: every test_* method, in name order (A1 first, which
+    # parallel mode relies on to warm the uv cache)
+    tests = [getattr(tester, name) for name in sorted(dir(tester)) if name.startswith("test_")]
 
+    # Not a with-block: leaving one on abort would wait for every queued scenario
+    pool: Optional[ThreadPoolExecutor] = None
+    try:
+        if jobs == 1:
+            for test_fn in tests:
+                _run_scenario(test_fn)
+        else:
+            # A1 installs REQUIRED_PACKAGES, so running it first warms the cache
+            # before the workers would otherwise download the same wheels at once
+            _run_scenario(tests[0])
+            # Scenarios wait on uv subprocesses in disjoint directories, so threads overlap them
+            pool = ThreadPoolExecutor(max_workers=jobs)
+            list(pool.map(_run_scenario, tests[1:]))
+            pool.shutdown()
+    except BaseException:
+        # Aborted (e.g. Ctrl+C): drop the queued scenarios, let the background
+        # deletions finish, then don't leave partial venvs behind
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        tester.wait_for_cleanup()
+        shutil.rmtree(test_base, ignore_errors=True)
+        _safe_print(f"\nAborted; results recorded so far are in {RESULTS_PATH}")
+        raise
+    tester.wait_for_cleanup()
+
+    # Summary: built up and printed in one write rather than one call per line
+    passed = _TALLY["PASS"]
+    failed = _TALLY["FAIL"]
+    total = passed + failed
+
+    lines = ["\n" + "=" * 70, "  TEST SUMMARY", "=" * 70]
     for r in RESULTS:
         icon = "[PASS]" if r["status"] == "PASS" else "[FAIL]"
-        _safe_print(f"  {icon} {r['test']}: {r['detail'][:80] if r['detail'] else ''}")
+        lines.append(f"  {icon} {r['test']}: {r['detail'][:80] if r['detail'] else ''}")
 
-    _safe_print(f"\n  Total: {total} | Passed: {passed} | Failed: {failed}")
+    lines.append(f"\n  Total: {total} | Passed: {passed} | Failed: {failed}")
 
     if failed > 0:
-        _safe_print("\n  [!] FAILED TESTS REQUIRE ATTENTION!")
+        lines.append("\n  [!] FAILED TESTS REQUIRE ATTENTION!")
         for r in RESULTS:
             if r["status"] == "FAIL":
-                _safe_print(f"    [FAIL] {r['test']}")
-                _safe_print(f"           {r['detail']}")
+                lines.append(f"    [FAIL] {r['test']}")
+                lines.append(f"           {r['detail']}")
+
+    # Cleanup: keep artifacts only when there is a failure to inspect
+    if failed > 0:
+        lines.append(f"\n  Test artifacts at: {test_base}")
+        lines.append(f'  Run: rmdir /s /q "{test_base}" to clean up')
+    else:
+        shutil.rmtree(test_base, ignore_errors=True)
+    lines.append(f"  Results log: {RESULTS_PATH}")
 
-    # Cleanup
-    print(f"\n  Test artifacts at: {TEST_BASE}")
-    print(f'  Run: rmdir /s /q "{TEST_BASE}" to clean up')
+    _safe_print("\n".join(lines))
 
     return 0 if failed == 0 else 1
 